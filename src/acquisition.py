@@ -139,7 +139,7 @@ class Acquisition:
     def base_dir(self, new_base_dir):
         self._base_dir = new_base_dir
         # Extract the name of the stack from the base directory
-        self.stack_name = self.base_dir[self.base_dir.rfind('\\') + 1:]
+        self.stack_name = os.path.basename(self.base_dir)
 
     def save_to_cfg(self):
         """Save current state of attributes to ConfigParser objects."""
@@ -255,6 +255,11 @@ class MainControls(QMainWindow):
             self.cfg['sys']['plc_installed'].lower() == 'true')
         self.plc_initialized = False
 
+        # The OV and grid settings dialogs are created when they are opened
+        # for the first time, and then reused.
+        self.ov_settings_dlg = None
+        self.grid_settings_dlg = None
+
         self.initialize_main_controls_gui()
 
         # Set up grid/tile selectors.
@@ -1116,11 +1121,14 @@ class MainControls(QMainWindow):
         dialog.exec_()
 
     def open_ov_dlg(self):
-        dialog = OVSettingsDlg(self.ovm, self.sem, self.ov_index_dropdown,
-                               self.trigger)
+        if self.ov_settings_dlg is None:
+            self.ov_settings_dlg = OVSettingsDlg(
+                self.ovm, self.sem, self.ov_index_dropdown, self.trigger)
+        else:
+            self.ov_settings_dlg.refresh(self.ov_index_dropdown)
         # self.update_from_ov_dlg() is called when user saves settings
         # or adds/deletes OVs.
-        dialog.exec_()
+        self.ov_settings_dlg.exec_()
 
     def update_from_ov_dlg(self):
         self.update_main_controls_ov_selector(self.ov_index_dropdown)
@@ -1133,11 +1141,15 @@ class MainControls(QMainWindow):
         self.viewport.vp_draw()
 
     def open_grid_dlg(self, selected_grid):
-        dialog = GridSettingsDlg(self.gm, self.sem, selected_grid,
-                                 self.trigger, self.magc_mode)
+        if self.grid_settings_dlg is None:
+            self.grid_settings_dlg = GridSettingsDlg(
+                self.gm, self.sem, selected_grid, self.trigger,
+                self.magc_mode)
+        else:
+            self.grid_settings_dlg.refresh(selected_grid)
         # self.update_from_grid_dlg() is called when user saves settings
         # or adds/deletes grids.
-        dialog.exec_()
+        self.grid_settings_dlg.exec_()
 
     def update_from_grid_dlg(self):
         # Update selectors:
@@ -2143,7 +2155,7 @@ class MainControls(QMainWindow):
         # Default pixel size is 6 nm.
         self.spinBox_ftPixelSize.setValue(6)
         # Default dwell time is dwell time selector 4
-        self.comboBox_dwellTime.addItems(map(str, self.sem.DWELL_TIME))
+        self.comboBox_dwellTime.addItems(self.sem.DWELL_TIME_STRS)
         self.comboBox_dwellTime.setCurrentIndex(4)
         # Selectors
         self.ft_update_grid_selector()
@@ -2316,7 +2328,7 @@ class MainControls(QMainWindow):
         SEM control software and then manually set the tile/OV to the new focus
         parameters."""
         if (self.ft_selected_tile >=0) or (self.ft_selected_ov >= 0):
-            dialog = FTMoveDlg(self.microtome, self.cs, self.gm,
+            dialog = FTMoveDlg(self.microtome, self.cs, self.gm, self.ovm,
                                self.ft_selected_grid, self.ft_selected_tile,
                                self.ft_selected_ov)
             if dialog.exec_():
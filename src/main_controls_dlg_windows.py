@@ -13,36 +13,242 @@ Controls, and the startup dialog (ConfigDlg).
 """
 
 import os
+import io
 import re
+import array
+import ctypes
 import string
 import threading
 import datetime
+import gc
 import glob
-import json
-import validators
-import requests
-import shutil
-
-from random import random
-from time import sleep, time
-from validate_email import validate_email
-from math import atan, sqrt
+
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from queue import Queue
+from time import sleep, monotonic
+from math import atan2, hypot
 from statistics import mean
-from PIL import Image
-from skimage.io import imread
-from skimage.feature import register_translation
-import numpy as np
-from imreg_dft import translation
-from zipfile import ZipFile
-
-from PyQt5.uic import loadUi
-from PyQt5.QtCore import Qt, QObject, QSize, pyqtSignal
-from PyQt5.QtGui import QPixmap, QIcon, QPalette, QColor, QFont
+
+from PyQt5.uic import loadUi, loadUiType
+from PyQt5.QtCore import Qt, QSize, QRegularExpression, QStringListModel, \
+                         QTimer
+from PyQt5.QtGui import QPixmap, QPixmapCache, QIcon, QPalette, QColor, \
+                        QFont, QRegularExpressionValidator, \
+                        QStandardItemModel, QStandardItem
 from PyQt5.QtWidgets import QApplication, QDialog, QMessageBox, \
-                            QFileDialog, QLineEdit, QDialogButtonBox
+                            QFileDialog, QLineEdit, QSpinBox, QDoubleSpinBox, \
+                            QAbstractButton, QAbstractSpinBox, QComboBox
 
 import utils
-import acq_func
+
+# Downsampling factor for the calibration images before computing the shifts,
+# and size of the full-resolution patch used to refine the shifts.
+CALIBRATION_DOWNSAMPLING = 4
+CALIBRATION_PATCH_SIZE = 256
+
+# Permitted characters for names of configuration files. Spaces are
+# accepted while typing and replaced with underscores.
+_CFG_NAME_PATTERN = r'[A-Za-z0-9_ -]+'
+
+# Drive letter at the beginning of a full path, for example 'D:\'
+_DRIVE_LETTER_RE = re.compile(r'^[A-Za-z]:\\$')
+# Flag to open files for sequential access (only available on Windows)
+_O_SEQUENTIAL = getattr(os, 'O_SEQUENTIAL', 0)
+# Flag to open files without newline translation by the C runtime (Windows)
+_O_BINARY = getattr(os, 'O_BINARY', 0)
+# Replace spaces and forward slashes in the base directory in a single pass
+_BASE_DIR_TRANS = str.maketrans({' ': '_', '/': '\\'})
+
+# Icons loaded so far, by file name
+_icons = {}
+
+def _icon(path):
+    """Return the QIcon for the image file path. Each file is loaded only
+    once, and the same QIcon is shared by all dialogs.
+    """
+    icon = _icons.get(path)
+    if icon is None:
+        icon = _icons[path] = QIcon(path)
+    return icon
+
+def _pixmap(path):
+    """Return the QPixmap for the image file path. The pixmap is kept in Qt's
+    global QPixmapCache, so that the file is not decoded again each time a
+    dialog is opened.
+    """
+    pixmap = QPixmapCache.find(path)
+    if pixmap is None:
+        pixmap = QPixmap(path)
+        QPixmapCache.insert(path, pixmap)
+    return pixmap
+
+def _disable_keyboard_tracking(dialog):
+    """Disable keyboard tracking for all spin boxes in dialog, so that
+    valueChanged is emitted only when the user has finished editing the value
+    (or uses the arrows), and not after every keystroke.
+    """
+    for spinbox in dialog.findChildren((QSpinBox, QDoubleSpinBox)):
+        spinbox.setKeyboardTracking(False)
+
+def _block_widget_signals(dialog):
+    """Block the signals of all input widgets in dialog and return the list
+    of these widgets. Used while a dialog is populated with the current
+    settings, so that no signals are emitted for the values that are set
+    programmatically. Pass the list to _unblock_widget_signals() afterwards.
+    """
+    widgets = dialog.findChildren(
+        (QAbstractButton, QAbstractSpinBox, QComboBox, QLineEdit))
+    for widget in widgets:
+        widget.blockSignals(True)
+    return widgets
+
+def _unblock_widget_signals(widgets):
+    for widget in widgets:
+        widget.blockSignals(False)
+
+def _show_settings(dialog, obj, bindings):
+    """Show the settings stored as attributes of obj in the spin boxes and
+    check boxes of dialog. bindings contains (attribute name, widget name)
+    pairs.
+    """
+    for attr, widget_name in bindings:
+        widget = getattr(dialog, widget_name)
+        if isinstance(widget, QAbstractButton):
+            widget.setChecked(getattr(obj, attr))
+        else:
+            widget.setValue(getattr(obj, attr))
+
+def _store_settings(dialog, obj, bindings):
+    """Store the values of the spin boxes and check boxes of dialog as
+    attributes of obj (the reverse of _show_settings()).
+    """
+    for attr, widget_name in bindings:
+        widget = getattr(dialog, widget_name)
+        if isinstance(widget, QAbstractButton):
+            setattr(obj, attr, widget.isChecked())
+        else:
+            setattr(obj, attr, widget.value())
+
+# Entries parsed from the imagelist files by ExportDlg, by logs directory and
+# grid index, together with the files' modification times
+_imagelist_cache = {}
+
+# Session for downloads from GitHub, created on first use
+_github_session = None
+
+def _get_github_session():
+    """Return the requests session for downloads from GitHub. The connection
+    is reused for subsequent downloads, and failed requests are retried up to
+    three times.
+    """
+    global _github_session
+    if _github_session is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        _github_session = requests.Session()
+        _github_session.mount(
+            'https://',
+            HTTPAdapter(max_retries=Retry(total=3, backoff_factor=0.5)))
+    return _github_session
+
+
+def _load_frame(path):
+    """Load a frame saved by the SEM as a single-channel float32 NumPy array.
+    PIL decodes the TIFF directly, without skimage's plugin dispatch and grey
+    conversion of images that are already greyscale. Single precision is
+    sufficient for the shift computations, and the FFTs of float32 arrays
+    are computed in complex64, which halves memory use and bandwidth.
+    """
+    import numpy as np
+    from PIL import Image
+    with Image.open(path) as img:
+        if img.mode not in ('L', 'I', 'I;16', 'F'):
+            img = img.convert('L')
+        return np.asarray(img, dtype=np.float32)
+
+@lru_cache(maxsize=8)
+def _hann_window(shape):
+    """Return a (read-only) 2D float32 Hann window. The windows are cached
+    because the same image and patch sizes are used repeatedly.
+    """
+    import numpy as np
+    window = np.outer(np.hanning(shape[0]),
+                      np.hanning(shape[1])).astype(np.float32)
+    window.setflags(write=False)
+    return window
+
+def _windowed_rfft2(img):
+    """Return the real 2D FFT of img multiplied with a Hann window. The window
+    suppresses the edge discontinuities (and periodic scan artifacts at the
+    image borders) that would otherwise produce spurious correlation peaks.
+    The FFT itself is compute-bound and runs on all cores (workers=-1).
+    """
+    import numpy as np
+    from scipy.fft import rfft2
+    windowed = np.multiply(img, _hann_window(img.shape), dtype=np.float32)
+    return rfft2(windowed, workers=-1, overwrite_x=True)
+
+def _phase_correlation(ref_fft, mov):
+    """Return the shift [row, column] between a reference image and the
+    image mov, computed by phase correlation. ref_fft is the precomputed
+    windowed FFT of the reference image (see _windowed_rfft2), so that it can
+    be reused for several images. The sign convention is the same as for
+    skimage's phase_cross_correlation (shift required to register mov with the
+    reference).
+    """
+    import numpy as np
+    from scipy.fft import irfft2
+    # The pointwise operations are memory-bound, so they are done in place
+    # to avoid allocating temporary arrays of the full spectrum size.
+    cross_power = _windowed_rfft2(mov)
+    np.conjugate(cross_power, out=cross_power)
+    cross_power *= ref_fft
+    # Normalize to unit magnitude to obtain a sharp correlation peak
+    magnitude = np.abs(cross_power)
+    magnitude += 1e-12
+    cross_power /= magnitude
+    del magnitude
+    corr = irfft2(cross_power, s=mov.shape, workers=-1)
+    # Integer peak position of the flattened correlation surface, converted
+    # to (row, column) as plain Python ints
+    peak = divmod(int(corr.argmax()), corr.shape[1])
+    # Peaks beyond the centre correspond to negative shifts (FFT wraparound)
+    return [p - n if p > n // 2 else p for p, n in zip(peak, corr.shape)]
+
+def _estimate_shift(ref_img, ref_ds_fft, mov):
+    """Return the shift [row, column] between ref_img and mov. The shift is
+    first computed from downsampled images (ref_ds_fft is the precomputed FFT
+    of the downsampled reference image) and then refined at full resolution.
+    """
+    from skimage.transform import downscale_local_mean
+    mov_ds = downscale_local_mean(
+        mov, (CALIBRATION_DOWNSAMPLING, CALIBRATION_DOWNSAMPLING))
+    coarse_shift = [CALIBRATION_DOWNSAMPLING * d
+                    for d in _phase_correlation(ref_ds_fft, mov_ds)]
+    return _refine_shift(ref_img, mov, coarse_shift)
+
+def _refine_shift(ref_img, mov, coarse_shift,
+                  patch_size=CALIBRATION_PATCH_SIZE):
+    """Refine coarse_shift by correlating a patch of mov at full resolution
+    with the corresponding patch of ref_img (offset by coarse_shift). The
+    patch is centred in the overlap region of both images.
+    """
+    origin = []
+    for shift, length in zip(coarse_shift, mov.shape):
+        lower, upper = max(0, -shift), min(length, length - shift) - patch_size
+        if upper < lower:
+            # Overlap too small for refinement
+            return coarse_shift
+        origin.append((lower + upper) // 2)
+    (r, c), (dr, dc) = origin, coarse_shift
+    mov_patch = mov[r:r + patch_size, c:c + patch_size]
+    ref_patch = ref_img[r + dr:r + dr + patch_size,
+                        c + dc:c + dc + patch_size]
+    residual = _phase_correlation(_windowed_rfft2(ref_patch), mov_patch)
+    return [s + d for s, d in zip(coarse_shift, residual)]
 
 
 class ConfigDlg(QDialog):
@@ -56,48 +262,48 @@ class ConfigDlg(QDialog):
     def __init__(self, VERSION):
         super().__init__()
         loadUi('..\\gui\\config_dlg.ui', self)
-        self.setWindowIcon(QIcon('..\\img\\icon_16px.ico'))
+        self.setWindowIcon(_icon('..\\img\\icon_16px.ico'))
         if VERSION.lower() == 'dev':
             self.label_version.setText('DEVELOPMENT VERSION')
         else:
             self.label_version.setText('Version ' + VERSION)
-        self.labelIcon.setPixmap(QPixmap('..\\img\\logo.png'))
+        self.labelIcon.setPixmap(_pixmap('..\\img\\logo.png'))
         self.label_website.setText('<a href="https://github.com/SBEMimage">'
                                    'https://github.com/SBEMimage</a>')
         self.label_website.setOpenExternalLinks(True)
         self.setFixedSize(self.size())
-        self.show()
         self.abort = False
-        # Populate the list widget with existing .ini files
-        inifile_list = []
-        for file in os.listdir('..\\cfg'):
-            if file.endswith('.ini'):
-                inifile_list.append(file)
-        self.listWidget_filelist.addItems(inifile_list)
+        # Populate the list widget with existing .ini files. os.scandir()
+        # avoids a separate stat call for each directory entry.
+        with os.scandir('..\\cfg') as entries:
+            inifile_list = [entry.name for entry in entries
+                            if entry.name.endswith('.ini')]
+        # Attach a fully populated model, so that the view is laid out once
+        self.listView_filelist.setUpdatesEnabled(False)
+        self.inifile_model = QStandardItemModel(self)
+        self.inifile_model.appendColumn(
+            [QStandardItem(name) for name in inifile_list])
+        self.listView_filelist.setModel(self.inifile_model)
+        # Map file names to rows for selecting the preselected file
+        row_map = {name: row for row, name in enumerate(inifile_list)}
+        # This dialog is called from SBEMimage.py only if default.ini
+        # is found in cfg directory.
+        default_row = row_map['default.ini']
         # Which .ini file was used previously? Check in status.dat
-        if os.path.isfile('..\\cfg\\status.dat'):
-            status_file = open('..\\cfg\\status.dat', 'r')
-            last_inifile = status_file.readline()
-            status_file.close()
-            try:
-                last_item_used = self.listWidget_filelist.findItems(
-                    last_inifile, Qt.MatchExactly)[0]
-                self.listWidget_filelist.setCurrentItem(last_item_used)
-            except:
-                # If the file indicated in status.dat does not exist,
-                # select default.ini.
-                # This dialog is called from SBEMimage.py only if default.ini
-                # is found in cfg directory.
-                default_item = self.listWidget_filelist.findItems(
-                    'default.ini', Qt.MatchExactly)[0]
-                self.listWidget_filelist.setCurrentItem(default_item)
-        else:
+        try:
+            last_inifile = (Path('..\\cfg\\status.dat').read_text()
+                            .splitlines() or [''])[0].strip()
+        except FileNotFoundError:
+            last_inifile = None
+        # If the file indicated in status.dat does not exist (or status.dat is
+        # missing), select default.ini.
+        self.listView_filelist.setCurrentIndex(self.inifile_model.index(
+            row_map.get(last_inifile, default_row), 0))
+        self.listView_filelist.setUpdatesEnabled(True)
+        self.show()
+        if last_inifile is None:
             # If status.dat does not exist, the program must have crashed or a
-            # second instance is running. Display a warning and preselect
-            # default.ini in the list.
-            default_item = self.listWidget_filelist.findItems(
-                'default.ini', Qt.MatchExactly)[0]
-            self.listWidget_filelist.setCurrentItem(default_item)
+            # second instance is running. Display a warning.
             QMessageBox.warning(
                 self, 'Problem detected: Crash or other SBEMimage instance '
                 'running',
@@ -115,7 +321,7 @@ class ConfigDlg(QDialog):
 
     def get_ini_file(self):
         if not self.abort:
-            return self.listWidget_filelist.currentItem().text()
+            return self.listView_filelist.currentIndex().data()
         else:
             return 'abort'
 
@@ -128,27 +334,27 @@ class SaveConfigDlg(QDialog):
         super().__init__()
         loadUi('..\\gui\\save_config_dlg.ui', self)
         self.setWindowModality(Qt.ApplicationModal)
-        self.setWindowIcon(QIcon('..\\img\\icon_16px.ico'))
+        self.setWindowIcon(_icon('..\\img\\icon_16px.ico'))
         self.setFixedSize(self.size())
-        self.show()
         self.lineEdit_cfgFileName.setText('')
+        # Only permitted characters can be entered
+        self.lineEdit_cfgFileName.setValidator(QRegularExpressionValidator(
+            QRegularExpression(_CFG_NAME_PATTERN), self))
         self.file_name = None
+        self.show()
 
     def accept(self):
         # Replace spaces in file name with underscores.
-        self.lineEdit_cfgFileName.setText(
-            self.lineEdit_cfgFileName.text().replace(' ', '_'))
-        # Check whether characters in name are permitted.
+        name = self.lineEdit_cfgFileName.text().replace(' ', '_')
+        self.lineEdit_cfgFileName.setText(name)
         # default.ini may not be chosen.
-        reg = re.compile('^[a-zA-Z0-9_-]+$')
-        if (reg.match(self.lineEdit_cfgFileName.text())
-                and self.lineEdit_cfgFileName.text().lower != 'default'):
-            self.file_name = self.lineEdit_cfgFileName.text() + '.ini'
+        if name and name.lower() != 'default':
+            self.file_name = name + '.ini'
             super().accept()
         else:
             QMessageBox.warning(
                 self, 'Error',
-                'Name contains forbidden characters.',
+                'Please enter a name other than "default".',
                 QMessageBox.Ok)
 
 # ------------------------------------------------------------------------------
@@ -163,20 +369,52 @@ class SEMSettingsDlg(QDialog):
         self.sem = sem
         loadUi('..\\gui\\sem_settings_dlg.ui', self)
         self.setWindowModality(Qt.ApplicationModal)
-        self.setWindowIcon(QIcon('..\\img\\icon_16px.ico'))
+        self.setWindowIcon(_icon('..\\img\\icon_16px.ico'))
         self.setFixedSize(self.size())
-        self.show()
-        # Display actual settings from SmartSEM
-        self.doubleSpinBox_actualEHT.setValue(self.sem.get_eht())
-        self.spinBox_actualBeamCurrent.setValue(self.sem.get_beam_current())
         # Display current target settings
         self.doubleSpinBox_EHT.setValue(self.sem.target_eht)
         self.spinBox_beamCurrent.setValue(self.sem.target_beam_current)
-        # Display current working distance and stigmation parameters
+        # The actual settings are read from SmartSEM in a thread, so that
+        # the dialog opens without waiting for the SEM. Show placeholders
+        # until they are available.
+        self.lineEdit_currentFocus.setText('...')
+        self.lineEdit_currentStigX.setText('...')
+        self.lineEdit_currentStigY.setText('...')
+        self.beam_snapshot = None
+        # Exception raised while reading the settings, if any
+        self.beam_snapshot_error = None
+        self.snapshot_trigger = utils.Trigger()
+        self.snapshot_trigger.signal.connect(self.show_beam_snapshot)
+        threading.Thread(target=self.beam_snapshot_thread).start()
+        self.show()
+
+    def beam_snapshot_thread(self):
+        try:
+            self.beam_snapshot = self.sem.get_beam_snapshot()
+        except Exception as e:
+            self.beam_snapshot_error = e
+        self.snapshot_trigger.signal.emit()
+
+    def show_beam_snapshot(self):
+        """Display actual settings, current working distance and stigmation
+        parameters read from SmartSEM."""
+        if self.beam_snapshot_error is not None:
+            self.lineEdit_currentFocus.setText('N/A')
+            self.lineEdit_currentStigX.setText('N/A')
+            self.lineEdit_currentStigY.setText('N/A')
+            QMessageBox.warning(
+                self, 'Error',
+                'Could not read current settings from SmartSEM: '
+                + str(self.beam_snapshot_error),
+                QMessageBox.Ok)
+            return
+        snapshot = self.beam_snapshot
+        self.doubleSpinBox_actualEHT.setValue(snapshot['eht'])
+        self.spinBox_actualBeamCurrent.setValue(snapshot['beam_current'])
         self.lineEdit_currentFocus.setText(
-            '{0:.6f}'.format(sem.get_wd() * 1000))
-        self.lineEdit_currentStigX.setText('{0:.6f}'.format(sem.get_stig_x()))
-        self.lineEdit_currentStigY.setText('{0:.6f}'.format(sem.get_stig_y()))
+            f"{snapshot['wd'] * 1000:.6f}")
+        self.lineEdit_currentStigX.setText(f"{snapshot['stig_x']:.6f}")
+        self.lineEdit_currentStigY.setText(f"{snapshot['stig_y']:.6f}")
 
     def accept(self):
         self.sem.set_eht(self.doubleSpinBox_EHT.value())
@@ -200,9 +438,8 @@ class MicrotomeSettingsDlg(QDialog):
         self.microtom_active = microtome_active
         loadUi('..\\gui\\microtome_settings_dlg.ui', self)
         self.setWindowModality(Qt.ApplicationModal)
-        self.setWindowIcon(QIcon('..\\img\\icon_16px.ico'))
+        self.setWindowIcon(_icon('..\\img\\icon_16px.ico'))
         self.setFixedSize(self.size())
-        self.show()
         # Labels and selection options depend on whether microtome stage or
         # SEM stage is used.
         if microtome_active:
@@ -250,6 +487,7 @@ class MicrotomeSettingsDlg(QDialog):
         # Motor speeds:
         self.lineEdit_speedX.setText(str(speed_x))
         self.lineEdit_speedY.setText(str(speed_y))
+        self.show()
 
     def accept(self):
         if self.microtom_active:
@@ -275,9 +513,8 @@ class KatanaSettingsDlg(QDialog):
         self.microtome = microtome
         loadUi('..\\gui\\katana_settings_dlg.ui', self)
         self.setWindowModality(Qt.ApplicationModal)
-        self.setWindowIcon(QIcon('..\\img\\icon_16px.ico'))
+        self.setWindowIcon(_icon('..\\img\\icon_16px.ico'))
         self.setFixedSize(self.size())
-        self.show()
 
         # Set up COM port selector
         self.comboBox_portSelector.addItems(utils.get_serial_ports())
@@ -287,6 +524,7 @@ class KatanaSettingsDlg(QDialog):
 
         self.display_connection_status()
         self.display_current_settings()
+        self.show()
 
     def reconnect(self):
         pass
@@ -390,12 +628,11 @@ class StageCalibrationDlg(QDialog):
 
         loadUi('..\\gui\\stage_calibration_dlg.ui', self)
         self.setWindowModality(Qt.ApplicationModal)
-        self.setWindowIcon(QIcon('..\\img\\icon_16px.ico'))
+        self.setWindowIcon(_icon('..\\img\\icon_16px.ico'))
         self.setFixedSize(self.size())
-        self.show()
-        self.arrow_symbol1.setPixmap(QPixmap('..\\img\\arrow.png'))
-        self.arrow_symbol2.setPixmap(QPixmap('..\\img\\arrow.png'))
-        self.lineEdit_EHT.setText('{0:.2f}'.format(self.sem.target_eht))
+        self.arrow_symbol1.setPixmap(_pixmap('..\\img\\arrow.png'))
+        self.arrow_symbol2.setPixmap(_pixmap('..\\img\\arrow.png'))
+        self.lineEdit_EHT.setText(f'{self.sem.target_eht:.2f}')
         params = self.cs.stage_calibration
         self.doubleSpinBox_stageScaleFactorX.setValue(params[0])
         self.doubleSpinBox_stageScaleFactorY.setValue(params[1])
@@ -403,9 +640,9 @@ class StageCalibrationDlg(QDialog):
         self.doubleSpinBox_stageRotationY.setValue(params[3])
         self.doubleSpinBox_motorSpeedX.setValue(self.stage.motor_speed_x)
         self.doubleSpinBox_motorSpeedY.setValue(self.stage.motor_speed_y)
-        self.comboBox_dwellTime.addItems(map(str, self.sem.DWELL_TIME))
+        self.comboBox_dwellTime.addItems(self.sem.DWELL_TIME_STRS)
         self.comboBox_dwellTime.setCurrentIndex(4)
-        self.comboBox_package.addItems(['imreg_dft', 'skimage'])
+        self.comboBox_package.addItems(['scipy', 'skimage'])
         self.pushButton_startImageAcq.clicked.connect(
             self.start_stage_calibration_procedure)
         if self.sem.simulation_mode:
@@ -415,6 +652,7 @@ class StageCalibrationDlg(QDialog):
             self.calculate_calibration_parameters_from_user_input)
         self.pushButton_calcMotor.clicked.connect(
             self.calculate_motor_speeds)
+        self.show()
 
     def calculate_motor_speeds(self):
         """Calculate the motor speeds from the duration measurements provided
@@ -426,9 +664,9 @@ class StageCalibrationDlg(QDialog):
         motor_speed_y = 1000 / duration_y
         user_choice = QMessageBox.information(
             self, 'Calculated motor speeds',
-            'Results:\nMotor speed X: ' + '{0:.2f}'.format(motor_speed_x)
-            + ';\nMotor speed Y: ' + '{0:.2f}'.format(motor_speed_y)
-            + '\n\nDo you want to use these values?',
+            f'Results:\nMotor speed X: {motor_speed_x:.2f};\n'
+            f'Motor speed Y: {motor_speed_y:.2f}\n\n'
+            'Do you want to use these values?',
             QMessageBox.Ok | QMessageBox.Cancel)
         if user_choice == QMessageBox.Ok:
             self.doubleSpinBox_motorSpeedX.setValue(motor_speed_x)
@@ -450,7 +688,7 @@ class StageCalibrationDlg(QDialog):
             'position. The recommended starting position is the centre of the '
             'stage (0, 0).\n'
             'Shift vectors between the acquired images will be computed using '
-            'a function from the selected package (imreg_dft or skimage). '
+            'a function from the selected package (scipy or skimage). '
             'Angles and scale factors will then be computed from these '
             'shifts.\n\n'
             'Alternatively, you can manually provide the pixel shifts by '
@@ -490,8 +728,11 @@ class StageCalibrationDlg(QDialog):
     def calibration_images_acq_thread(self):
         """Acquisition thread for three images used for the stage calibration.
         Frame settings are fixed for now. Currently no error handling. XY shifts
-        are computed from images with imreg_dft or skimage.
+        are computed from images with scipy (default) or skimage.
         """
+        # The scientific packages are only needed here and are slow to
+        # import, so they are not imported at module level.
+        from skimage.transform import downscale_local_mean
         shift = self.spinBox_shift.value()
         pixel_size = self.spinBox_pixelsize.value()
         dwell_time = self.sem.DWELL_TIME[self.comboBox_dwellTime.currentIndex()]
@@ -504,44 +745,69 @@ class StageCalibrationDlg(QDialog):
         self.sem.apply_frame_settings(
             frame_size_selector, pixel_size, dwell_time)
 
-        start_x, start_y = self.stage.get_xy()
-        # Acquire first image at starting position
-        self.sem.acquire_frame(self.base_dir + '\\start.tif')
-        # Shift along X stage
-        self.stage.move_to_xy((start_x + shift, start_y))
-        # Second image, at new X position (Y unchanged from starting position)
-        self.sem.acquire_frame(self.base_dir + '\\shift_x.tif')
-        # Shift along Y direction, X back to starting position
-        self.stage.move_to_xy((start_x, start_y + shift))
-        # Acquire third and final image, at new Y position
-        self.sem.acquire_frame(self.base_dir + '\\shift_y.tif')
-        # Move back to starting position
-        self.stage.move_to_xy((start_x, start_y))
-        # Show in log that calculation begins now
-        self.update_calc_trigger.signal.emit()
-        # Load images
-        start_img = imread(os.path.join(self.base_dir, 'start.tif'),
-                           as_gray=True)
-        shift_x_img = imread(os.path.join(self.base_dir, 'shift_x.tif'),
-                             as_gray=True)
-        shift_y_img = imread(os.path.join(self.base_dir, 'shift_y.tif'),
-                             as_gray=True)
-        self.calc_exception = None
+        start_path = os.path.join(self.base_dir, 'start.tif')
+        shift_x_path = os.path.join(self.base_dir, 'shift_x.tif')
+        shift_y_path = os.path.join(self.base_dir, 'shift_y.tif')
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            start_x, start_y = self.stage.get_xy()
+            # Acquire first image at starting position. Each image is loaded
+            # in the background while the next image is acquired.
+            self.sem.acquire_frame(start_path)
+            start_img_future = executor.submit(_load_frame, start_path)
+            # Shift along X stage
+            self.stage.move_to_xy((start_x + shift, start_y))
+            # Second image, at new X position (Y unchanged from starting
+            # position)
+            self.sem.acquire_frame(shift_x_path)
+            shift_x_img_future = executor.submit(_load_frame, shift_x_path)
+            # Shift along Y direction, X back to starting position
+            self.stage.move_to_xy((start_x, start_y + shift))
+            # Acquire third and final image, at new Y position
+            self.sem.acquire_frame(shift_y_path)
+            shift_y_img_future = executor.submit(_load_frame, shift_y_path)
+            # Move back to starting position
+            self.stage.move_to_xy((start_x, start_y))
+            # Show in log that calculation begins now
+            self.update_calc_trigger.signal.emit()
+            start_img = start_img_future.result()
+            shift_x_img = shift_x_img_future.result()
+            shift_y_img = shift_y_img_future.result()
+            self.calc_exception = None
 
-        try:
-            if self.comboBox_package.currentIndex() == 0:  # imreg_dft selected
-                # [::-1] to use x, y, z order
-                x_shift = translation(
-                    start_img, shift_x_img, filter_pcorr=3)['tvec'][::-1]
-                y_shift = translation(
-                    start_img, shift_y_img, filter_pcorr=3)['tvec'][::-1]
-            else:  # use skimage.register_translation
-                x_shift = register_translation(start_img, shift_x_img)[0][::-1]
-                y_shift = register_translation(start_img, shift_y_img)[0][::-1]
-            self.x_shift_vector = [x_shift[0], x_shift[1]]
-            self.y_shift_vector = [y_shift[0], y_shift[1]]
-        except Exception as e:
-            self.calc_exception = str(e)
+            try:
+                if self.comboBox_package.currentIndex() == 0:  # scipy
+                    # The FFT of the (downsampled) start image is computed
+                    # only once and used for both shift images.
+                    ref_ds_fft = _windowed_rfft2(
+                        downscale_local_mean(
+                            start_img,
+                            (CALIBRATION_DOWNSAMPLING,
+                             CALIBRATION_DOWNSAMPLING)))
+                    def compute_shift(img):
+                        return _estimate_shift(start_img, ref_ds_fft, img)
+                else:  # use skimage.registration.phase_cross_correlation
+                    from skimage.registration import phase_cross_correlation
+                    def compute_shift(img):
+                        return phase_cross_correlation(
+                            start_img, img, upsample_factor=10,
+                            normalization='phase')[0]
+                # Compute both shifts in parallel. [::-1] to use x, y order
+                x_shift_future = executor.submit(compute_shift, shift_x_img)
+                y_shift_future = executor.submit(compute_shift, shift_y_img)
+                x_shift = x_shift_future.result()[::-1]
+                y_shift = y_shift_future.result()[::-1]
+                # Plain floats, so that no NumPy objects are kept alive
+                self.x_shift_vector = (float(x_shift[0]), float(x_shift[1]))
+                self.y_shift_vector = (float(y_shift[0]), float(y_shift[1]))
+            except Exception as e:
+                self.calc_exception = str(e)
+        # Release the images and FFTs (also referenced by the futures and by
+        # compute_shift) before the results are shown in the GUI thread.
+        start_img = shift_x_img = shift_y_img = ref_ds_fft = None
+        start_img_future = shift_x_img_future = shift_y_img_future = None
+        compute_shift = None
+        gc.collect()
         self.finish_trigger.signal.emit()
 
     def update_log(self):
@@ -557,15 +823,15 @@ class StageCalibrationDlg(QDialog):
         self.pushButton_calcStage.setEnabled(True)
         if self.calc_exception is None:
             # Show the vectors in the textbox and the spinboxes
+            x_shift, y_shift = self.x_shift_vector, self.y_shift_vector
             self.plainTextEdit_calibLog.setPlainText(
-                'Shift_X: [{0:.1f}, {1:.1f}], '
-                'Shift_Y: [{2:.1f}, {3:.1f}]'.format(
-                *self.x_shift_vector, *self.y_shift_vector))
+                f'Shift_X: [{x_shift[0]:.1f}, {x_shift[1]:.1f}], '
+                f'Shift_Y: [{y_shift[0]:.1f}, {y_shift[1]:.1f}]')
             # Absolute values for the GUI
-            self.spinBox_x2x.setValue(abs(self.x_shift_vector[0]))
-            self.spinBox_x2y.setValue(abs(self.x_shift_vector[1]))
-            self.spinBox_y2x.setValue(abs(self.y_shift_vector[0]))
-            self.spinBox_y2y.setValue(abs(self.y_shift_vector[1]))
+            self.spinBox_x2x.setValue(round(abs(x_shift[0])))
+            self.spinBox_x2y.setValue(round(abs(x_shift[1])))
+            self.spinBox_y2x.setValue(round(abs(y_shift[0])))
+            self.spinBox_y2y.setValue(round(abs(y_shift[1])))
             # Now calculate parameters
             self.calculate_calibration_parameters()
         else:
@@ -587,13 +853,21 @@ class StageCalibrationDlg(QDialog):
             abs(self.x_shift_vector[0]), abs(self.x_shift_vector[1]))
         delta_yx, delta_yy = (
             abs(self.y_shift_vector[0]), abs(self.y_shift_vector[1]))
+        if delta_xx == 0 or delta_yy == 0:
+            self.busy = False
+            QMessageBox.warning(
+                self, 'Error computing stage calibration',
+                'The computed shifts are not valid. Please check the '
+                'calibration images.',
+                QMessageBox.Ok)
+            return
 
         # Rotation angles (in radians)
-        rot_x = atan(delta_xy/delta_xx)
-        rot_y = atan(delta_yx/delta_yy)
+        rot_x = atan2(delta_xy, delta_xx)
+        rot_y = atan2(delta_yx, delta_yy)
         # Scale factors
-        scale_x = shift / (sqrt(delta_xx**2 + delta_xy**2) * pixel_size / 1000)
-        scale_y = shift / (sqrt(delta_yx**2 + delta_yy**2) * pixel_size / 1000)
+        scale_x = shift / (hypot(delta_xx, delta_xy) * pixel_size / 1000)
+        scale_y = shift / (hypot(delta_yx, delta_yy) * pixel_size / 1000)
 
         # alternative calc
         # x_abs = np.linalg.norm(
@@ -617,11 +891,11 @@ class StageCalibrationDlg(QDialog):
         user_choice = QMessageBox.information(
             self, 'Calculated parameters',
             'Results:\n'
-            + 'Scale factor X: ' + '{0:.5f}'.format(scale_x)
-            + ';\nScale factor Y: ' + '{0:.5f}'.format(scale_y)
-            + '\nRotation X: ' + '{0:.5f}'.format(rot_x)
-            + ';\nRotation Y: ' + '{0:.5f}'.format(rot_y)
-            + '\n\nDo you want to use these values?',
+            f'Scale factor X: {scale_x:.5f};\n'
+            f'Scale factor Y: {scale_y:.5f}\n'
+            f'Rotation X: {rot_x:.5f};\n'
+            f'Rotation Y: {rot_y:.5f}\n\n'
+            'Do you want to use these values?',
             QMessageBox.Ok | QMessageBox.Cancel)
         if user_choice == QMessageBox.Ok:
             self.doubleSpinBox_stageScaleFactorX.setValue(scale_x)
@@ -703,28 +977,30 @@ class MagCalibrationDlg(QDialog):
         self.sem = sem
         loadUi('..\\gui\\mag_calibration_dlg.ui', self)
         self.setWindowModality(Qt.ApplicationModal)
-        self.setWindowIcon(QIcon('..\\img\\icon_16px.ico'))
+        self.setWindowIcon(_icon('..\\img\\icon_16px.ico'))
         self.setFixedSize(self.size())
-        self.show()
         self.spinBox_calibrationFactor.setValue(
             self.sem.MAG_PX_SIZE_FACTOR)
-        self.comboBox_frameWidth.addItems(['2048', '4096'])
+        self.frame_widths = (2048, 4096)
+        self.comboBox_frameWidth.addItems(
+            [str(width) for width in self.frame_widths])
         self.comboBox_frameWidth.setCurrentIndex(1)
         self.pushButton_calculate.clicked.connect(
             self.calculate_calibration_factor)
+        self.show()
 
     def calculate_calibration_factor(self):
         """Calculate the mag calibration factor from the frame width, the
         magnification and the pixel size.
         """
-        frame_width = int(str(self.comboBox_frameWidth.currentText()))
+        frame_width = self.frame_widths[self.comboBox_frameWidth.currentIndex()]
         pixel_size = self.doubleSpinBox_pixelSize.value()
         mag = self.spinBox_mag.value()
         new_factor = mag * frame_width * pixel_size
         user_choice = QMessageBox.information(
             self, 'Calculated calibration factor',
-            'Result:\nNew magnification calibration factor: %d '
-            '\n\nDo you want to use this value?' % new_factor,
+            'Result:\nNew magnification calibration factor: '
+            f'{int(new_factor)} \n\nDo you want to use this value?',
             QMessageBox.Ok | QMessageBox.Cancel)
         if user_choice == QMessageBox.Ok:
             self.spinBox_calibrationFactor.setValue(new_factor)
@@ -745,7 +1021,7 @@ class CutDurationDlg(QDialog):
         self.microtome = microtome
         loadUi('..\\gui\\cut_duration_dlg.ui', self)
         self.setWindowModality(Qt.ApplicationModal)
-        self.setWindowIcon(QIcon('..\\img\\icon_16px.ico'))
+        self.setWindowIcon(_icon('..\\img\\icon_16px.ico'))
         self.setFixedSize(self.size())
         self.show()
         self.doubleSpinBox_cutDuration.setValue(
@@ -769,9 +1045,17 @@ class OVSettingsDlg(QDialog):
         self.sem = sem
         self.current_ov = current_ov
         self.main_controls_trigger = main_controls_trigger
+        # Notifications to Main Controls are coalesced: several changes in
+        # quick succession result in a single 'OV SETTINGS CHANGED'.
+        self.notification_pending = False
+        self.notify_timer = QTimer(self)
+        self.notify_timer.setSingleShot(True)
+        self.notify_timer.setInterval(0)
+        self.notify_timer.timeout.connect(self.flush_notification)
         loadUi('..\\gui\\overview_settings_dlg.ui', self)
+        _disable_keyboard_tracking(self)
         self.setWindowModality(Qt.ApplicationModal)
-        self.setWindowIcon(QIcon('..\\img\\icon_16px.ico'))
+        self.setWindowIcon(_icon('..\\img\\icon_16px.ico'))
         self.setFixedSize(self.size())
         self.show()
         # Set up OV selector
@@ -785,14 +1069,23 @@ class OVSettingsDlg(QDialog):
         self.radioButton_active.toggled.connect(self.update_active_status)
         self.update_active_status()
         # Set up other comboboxes
-        store_res_list = [
-            '%d × %d' % (res[0], res[1]) for res in self.sem.STORE_RES]
-        self.comboBox_frameSize.addItems(store_res_list)
+        self.store_res = self.sem.STORE_RES
+        # Frame widths by frame size selector and mag calibration factor, for
+        # update_pixel_size()
+        self.store_widths = tuple(res[0] for res in self.store_res)
+        self.mag_factor = self.sem.MAG_PX_SIZE_FACTOR
+        self.comboBox_frameSize.addItems(self.sem.STORE_RES_STRS)
+        # Update pixel size when frame size or mag changed. Changes in quick
+        # succession are collapsed into a single update with a timer.
+        self.pixel_size_timer = QTimer(self)
+        self.pixel_size_timer.setSingleShot(True)
+        self.pixel_size_timer.setInterval(50)
+        self.pixel_size_timer.timeout.connect(self.update_pixel_size)
         self.comboBox_frameSize.currentIndexChanged.connect(
-            self.update_pixel_size)
-        self.comboBox_dwellTime.addItems(map(str, self.sem.DWELL_TIME))
-        # Update pixel size when mag changed
-        self.spinBox_magnification.valueChanged.connect(self.update_pixel_size)
+            self.schedule_pixel_size_update)
+        self.comboBox_dwellTime.addItems(self.sem.DWELL_TIME_STRS)
+        self.spinBox_magnification.valueChanged.connect(
+            self.schedule_pixel_size_update)
         # Button to clear OV image in Viewport
         self.pushButton_clearViewportImage.clicked.connect(
             self.clear_viewport_image)
@@ -804,6 +1097,20 @@ class OVSettingsDlg(QDialog):
         self.show_current_settings()
         self.show_frame_size()
 
+    def refresh(self, current_ov):
+        """Update the dialog before it is opened again. OVs may have been
+        added, deleted or modified since it was last shown.
+        """
+        self.current_ov = current_ov
+        self.mag_factor = self.sem.MAG_PX_SIZE_FACTOR
+        self.comboBox_OVSelector.blockSignals(True)
+        self.comboBox_OVSelector.clear()
+        self.comboBox_OVSelector.addItems(self.ovm.ov_selector_list())
+        self.comboBox_OVSelector.setCurrentIndex(self.current_ov)
+        self.comboBox_OVSelector.blockSignals(False)
+        self.show_selected_ov()
+        self.show_frame_size()
+
     def update_active_status(self):
         # If current OV is inactive, disable GUI elements
         b = self.radioButton_active.isChecked()
@@ -827,25 +1134,35 @@ class OVSettingsDlg(QDialog):
         self.spinBox_acqIntervalOffset.setValue(
             self.ovm[self.current_ov].acq_interval_offset)
 
+    def schedule_pixel_size_update(self):
+        # (Re)start the timer, update_pixel_size() is called when it expires
+        self.pixel_size_timer.start()
+
     def update_pixel_size(self):
         """Calculate pixel size from current magnification and display it."""
-        pixel_size = (
-            self.sem.MAG_PX_SIZE_FACTOR
-            / (self.sem.STORE_RES[self.comboBox_frameSize.currentIndex()][0]
-            * self.spinBox_magnification.value()))
+        pixel_size = self.mag_factor / (
+            self.store_widths[self.comboBox_frameSize.currentIndex()]
+            * self.spinBox_magnification.value())
         self.doubleSpinBox_pixelSize.setValue(pixel_size)
 
     def show_frame_size(self):
         """Calculate and show frame size depending on user selection."""
         frame_size_selector = self.ovm[self.current_ov].frame_size_selector
         pixel_size = self.ovm[self.current_ov].pixel_size
-        width = self.sem.STORE_RES[frame_size_selector][0] * pixel_size / 1000
-        height = self.sem.STORE_RES[frame_size_selector][1] * pixel_size / 1000
-        self.label_frameSize.setText('{0:.1f} × '.format(width)
-                                    + '{0:.1f}'.format(height))
+        frame_width, frame_height = self.store_res[frame_size_selector]
+        width = frame_width * pixel_size / 1000
+        height = frame_height * pixel_size / 1000
+        self.label_frameSize.setText(f'{width:.1f} × {height:.1f}')
 
     def change_ov(self):
-        self.current_ov = self.comboBox_OVSelector.currentIndex()
+        selected_ov = self.comboBox_OVSelector.currentIndex()
+        if selected_ov == self.current_ov:
+            # Selection unchanged, nothing to update
+            return
+        self.current_ov = selected_ov
+        self.show_selected_ov()
+
+    def show_selected_ov(self):
         if self.ovm[self.current_ov].active:
             self.radioButton_active.setChecked(True)
         else:
@@ -870,9 +1187,24 @@ class OVSettingsDlg(QDialog):
             'Save settings for OV %d' % self.current_ov)
         self.pushButton_deleteOV.setText('Delete OV %d' % self.current_ov)
 
+    def notify_main_controls(self):
+        self.notification_pending = True
+        self.notify_timer.start()
+
+    def flush_notification(self):
+        self.notify_timer.stop()
+        if self.notification_pending:
+            self.notification_pending = False
+            self.main_controls_trigger.transmit('OV SETTINGS CHANGED')
+
+    def done(self, result):
+        # Make sure that a pending notification is sent before closing
+        self.flush_notification()
+        super().done(result)
+
     def clear_viewport_image(self):
         self.ovm[self.current_ov].vp_file_path = ''
-        self.main_controls_trigger.transmit('OV SETTINGS CHANGED')
+        self.notify_main_controls()
 
     def save_current_settings(self):
         self.ovm[self.current_ov].active = self.radioButton_active.isChecked()
@@ -895,37 +1227,50 @@ class OVSettingsDlg(QDialog):
             or (self.spinBox_magnification.value() != self.prev_mag)):
             # Reset path to current overview image in Viewport
             self.ovm[self.current_ov].vp_file_path = ''
-        self.main_controls_trigger.transmit('OV SETTINGS CHANGED')
+        self.notify_main_controls()
 
     def add_ov(self):
         self.ovm.add_new_overview()
         self.current_ov = self.ovm.number_ov - 1
-        # Update OV selector:
+        # Update OV selector: only the new OV has to be added
         self.comboBox_OVSelector.blockSignals(True)
-        self.comboBox_OVSelector.clear()
-        self.comboBox_OVSelector.addItems(self.ovm.ov_selector_list())
+        self.comboBox_OVSelector.addItem(self.ovm.ov_selector_list()[-1])
         self.comboBox_OVSelector.setCurrentIndex(self.current_ov)
         self.comboBox_OVSelector.blockSignals(False)
-        self.change_ov()
-        self.main_controls_trigger.transmit('OV SETTINGS CHANGED')
+        self.show_selected_ov()
+        self.notify_main_controls()
 
     def delete_ov(self):
         self.ovm.delete_overview()
         self.current_ov = self.ovm.number_ov - 1
-        # Update OV selector:
+        # Update OV selector: the last OV has been deleted
         self.comboBox_OVSelector.blockSignals(True)
-        self.comboBox_OVSelector.clear()
-        self.comboBox_OVSelector.addItems(self.ovm.ov_selector_list())
+        self.comboBox_OVSelector.removeItem(
+            self.comboBox_OVSelector.count() - 1)
         self.comboBox_OVSelector.setCurrentIndex(self.current_ov)
         self.comboBox_OVSelector.blockSignals(False)
-        self.change_ov()
-        self.main_controls_trigger.transmit('OV SETTINGS CHANGED')
+        self.show_selected_ov()
+        self.notify_main_controls()
 
 # ------------------------------------------------------------------------------
 
 class GridSettingsDlg(QDialog):
     """Dialog for changing grid settings and for adding/deleting grids."""
 
+    # Icons for the colour selector, shared by all instances of the dialog
+    _colour_icons = None
+
+    @classmethod
+    def colour_icons(cls):
+        """Return the colour selector icons, created on first use."""
+        if cls._colour_icons is None:
+            cls._colour_icons = []
+            for rgb in utils.COLOUR_SELECTOR:
+                colour_icon = QPixmap(20, 10)
+                colour_icon.fill(QColor(*rgb))
+                cls._colour_icons.append(QIcon(colour_icon))
+        return cls._colour_icons
+
     def __init__(self, grid_manager, sem, selected_grid, main_controls_trigger,
                  magc_mode=False):
         super().__init__()
@@ -933,10 +1278,18 @@ class GridSettingsDlg(QDialog):
         self.sem = sem
         self.current_grid = selected_grid
         self.main_controls_trigger = main_controls_trigger
+        # Notifications to Main Controls are coalesced: several changes in
+        # quick succession result in a single 'GRID SETTINGS CHANGED'.
+        self.notification_pending = False
+        self.notify_timer = QTimer(self)
+        self.notify_timer.setSingleShot(True)
+        self.notify_timer.setInterval(0)
+        self.notify_timer.timeout.connect(self.flush_notification)
         self.magc_mode = magc_mode
         loadUi('..\\gui\\grid_settings_dlg.ui', self)
+        _disable_keyboard_tracking(self)
         self.setWindowModality(Qt.ApplicationModal)
-        self.setWindowIcon(QIcon('..\\img\\icon_16px.ico'))
+        self.setWindowIcon(_icon('..\\img\\icon_16px.ico'))
         self.setFixedSize(self.size())
         self.show()
         # Set up grid selector:
@@ -945,27 +1298,37 @@ class GridSettingsDlg(QDialog):
         self.comboBox_gridSelector.currentIndexChanged.connect(
             self.change_grid)
         # Set up colour selector:
-        for i in range(len(utils.COLOUR_SELECTOR)):
-            rgb = utils.COLOUR_SELECTOR[i]
-            colour_icon = QPixmap(20, 10)
-            colour_icon.fill(QColor(rgb[0], rgb[1], rgb[2]))
-            self.comboBox_colourSelector.addItem(QIcon(colour_icon), '')
+        # All items are placed in a model first, which is then set in one
+        # step (instead of one row insertion per addItem() call).
+        colour_icons = self.colour_icons()
+        colour_model = QStandardItemModel(
+            len(colour_icons), 1, self.comboBox_colourSelector)
+        for row, colour_icon in enumerate(colour_icons):
+            colour_model.setItem(row, 0, QStandardItem(colour_icon, ''))
+        self.comboBox_colourSelector.setModel(colour_model)
         if self.gm[self.current_grid].active:
             self.radioButton_active.setChecked(True)
         else:
             self.radioButton_inactive.setChecked(True)
         self.radioButton_active.toggled.connect(self.update_active_status)
         self.update_active_status()
-        store_res_list = [
-            '%d × %d' % (res[0], res[1]) for res in self.sem.STORE_RES]
-        self.comboBox_tileSize.addItems(store_res_list)
-        self.comboBox_tileSize.currentIndexChanged.connect(
+        self.store_res = self.sem.STORE_RES
+        self.comboBox_tileSize.addItems(self.sem.STORE_RES_STRS)
+        self.dwell_times = tuple(self.sem.DWELL_TIME)
+        self.comboBox_dwellTime.addItems(self.sem.DWELL_TIME_STRS)
+        # Changes of the tile size, dwell time and pixel size in quick
+        # succession are collapsed into a single update with a timer.
+        self.frame_size_and_dose_timer = QTimer(self)
+        self.frame_size_and_dose_timer.setSingleShot(True)
+        self.frame_size_and_dose_timer.setInterval(50)
+        self.frame_size_and_dose_timer.timeout.connect(
             self.show_frame_size_and_dose)
-        self.comboBox_dwellTime.addItems(map(str, self.sem.DWELL_TIME))
+        self.comboBox_tileSize.currentIndexChanged.connect(
+            self.schedule_frame_size_and_dose_update)
         self.comboBox_dwellTime.currentIndexChanged.connect(
-            self.show_frame_size_and_dose)
+            self.schedule_frame_size_and_dose_update)
         self.doubleSpinBox_pixelSize.valueChanged.connect(
-            self.show_frame_size_and_dose)
+            self.schedule_frame_size_and_dose_update)
         # Adaptive focus tool button:
         self.toolButton_focusGradient.clicked.connect(
             self.open_focus_gradient_dlg)
@@ -986,6 +1349,18 @@ class GridSettingsDlg(QDialog):
         if self.magc_mode:
             self.pushButton_addGrid.setEnabled(False)
 
+    def refresh(self, current_grid):
+        """Update the dialog before it is opened again. Grids may have been
+        added, deleted or modified since it was last shown.
+        """
+        self.current_grid = current_grid
+        self.comboBox_gridSelector.blockSignals(True)
+        self.comboBox_gridSelector.clear()
+        self.comboBox_gridSelector.addItems(self.gm.grid_selector_list())
+        self.comboBox_gridSelector.setCurrentIndex(self.current_grid)
+        self.comboBox_gridSelector.blockSignals(False)
+        self.show_selected_grid()
+
     def update_active_status(self):
         # If current grid is inactive, disable GUI elements
         b = self.radioButton_active.isChecked()
@@ -1027,26 +1402,41 @@ class GridSettingsDlg(QDialog):
         self.spinBox_acqIntervalOffset.setValue(
             self.gm[self.current_grid].acq_interval_offset)
 
+    def schedule_frame_size_and_dose_update(self):
+        # (Re)start the timer, show_frame_size_and_dose() is called when it
+        # expires
+        self.frame_size_and_dose_timer.start()
+
     def show_frame_size_and_dose(self):
         """Calculate and display the tile size and the dose for the current
         settings. Updated in real-time as user changes dwell time, frame
         resolution and pixel size.
         """
+        # A pending update is no longer needed
+        self.frame_size_and_dose_timer.stop()
         frame_size_selector = self.comboBox_tileSize.currentIndex()
         pixel_size = self.doubleSpinBox_pixelSize.value()
-        width = self.sem.STORE_RES[frame_size_selector][0] * pixel_size / 1000
-        height = self.sem.STORE_RES[frame_size_selector][1] * pixel_size / 1000
-        self.label_tileSize.setText('{0:.1f} × '.format(width)
-                                    + '{0:.1f}'.format(height))
+        frame_width, frame_height = self.store_res[frame_size_selector]
+        width = frame_width * pixel_size / 1000
+        height = frame_height * pixel_size / 1000
+        self.label_tileSize.setText(f'{width:.1f} × {height:.1f}')
+        # The dose is calculated with the target beam current, which is
+        # stored in the SEM object. No SEM query is needed.
         current = self.sem.target_beam_current
-        dwell_time = float(self.comboBox_dwellTime.currentText())
-        pixel_size = self.doubleSpinBox_pixelSize.value()
+        dwell_time = self.dwell_times[self.comboBox_dwellTime.currentIndex()]
         # Show electron dose in electrons per square nanometre.
         self.label_dose.setText('{0:.1f}'.format(
             utils.calculate_electron_dose(current, dwell_time, pixel_size)))
 
     def change_grid(self):
-        self.current_grid = self.comboBox_gridSelector.currentIndex()
+        selected_grid = self.comboBox_gridSelector.currentIndex()
+        if selected_grid == self.current_grid:
+            # Selection unchanged, nothing to update
+            return
+        self.current_grid = selected_grid
+        self.show_selected_grid()
+
+    def show_selected_grid(self):
         if self.gm[self.current_grid].active:
             self.radioButton_active.setChecked(True)
         else:
@@ -1071,17 +1461,31 @@ class GridSettingsDlg(QDialog):
             'Save settings for grid %d' % self.current_grid)
         self.pushButton_deleteGrid.setText('Delete grid %d' % self.current_grid)
 
+    def notify_main_controls(self):
+        self.notification_pending = True
+        self.notify_timer.start()
+
+    def flush_notification(self):
+        self.notify_timer.stop()
+        if self.notification_pending:
+            self.notification_pending = False
+            self.main_controls_trigger.transmit('GRID SETTINGS CHANGED')
+
+    def done(self, result):
+        # Make sure that a pending notification is sent before closing
+        self.flush_notification()
+        super().done(result)
+
     def add_grid(self):
         self.gm.add_new_grid()
         self.current_grid = self.gm.number_grids - 1
-        # Update grid selector:
+        # Update grid selector: only the new grid has to be added
         self.comboBox_gridSelector.blockSignals(True)
-        self.comboBox_gridSelector.clear()
-        self.comboBox_gridSelector.addItems(self.gm.grid_selector_list())
+        self.comboBox_gridSelector.addItem(self.gm.grid_selector_list()[-1])
         self.comboBox_gridSelector.setCurrentIndex(self.current_grid)
         self.comboBox_gridSelector.blockSignals(False)
-        self.change_grid()
-        self.main_controls_trigger.transmit('GRID SETTINGS CHANGED')
+        self.show_selected_grid()
+        self.notify_main_controls()
 
     def delete_grid(self):
         user_reply = QMessageBox.question(
@@ -1092,14 +1496,14 @@ class GridSettingsDlg(QDialog):
         if user_reply == QMessageBox.Ok:
             self.gm.delete_grid()
             self.current_grid = self.gm.number_grids - 1
-            # Update grid selector:
+            # Update grid selector: the last grid has been deleted
             self.comboBox_gridSelector.blockSignals(True)
-            self.comboBox_gridSelector.clear()
-            self.comboBox_gridSelector.addItems(self.gm.grid_selector_list())
+            self.comboBox_gridSelector.removeItem(
+                self.comboBox_gridSelector.count() - 1)
             self.comboBox_gridSelector.setCurrentIndex(self.current_grid)
             self.comboBox_gridSelector.blockSignals(False)
-            self.change_grid()
-            self.main_controls_trigger.transmit('GRID SETTINGS CHANGED')
+            self.show_selected_grid()
+            self.notify_main_controls()
 
     def reset_tile_previews(self):
         user_reply = QMessageBox.question(
@@ -1109,7 +1513,7 @@ class GridSettingsDlg(QDialog):
             QMessageBox.Ok | QMessageBox.Cancel)
         if user_reply == QMessageBox.Ok:
             self.gm[self.current_grid].clear_all_tile_previews()
-            self.main_controls_trigger.transmit('GRID SETTINGS CHANGED')
+            self.notify_main_controls()
 
     def reset_wd_stig_params(self):
         user_reply = QMessageBox.question(
@@ -1121,63 +1525,55 @@ class GridSettingsDlg(QDialog):
         if user_reply == QMessageBox.Ok:
             self.gm[self.current_grid].set_wd_for_all_tiles(0)
             self.gm[self.current_grid].set_stig_xy_for_all_tiles([0, 0])
-            self.main_controls_trigger.transmit('GRID SETTINGS CHANGED')
+            self.notify_main_controls()
 
     def save_current_settings(self):
         error_msg = ''
+        grid = self.gm[self.current_grid]
         # Update tile positions only once after updating all grid attributes
-        self.gm[self.current_grid].auto_update_tile_positions = False
+        grid.auto_update_tile_positions = False
 
         if self.magc_mode:
             # Preserve centre coordinates of MagC grids
-            prev_grid_centre = self.gm[self.current_grid].centre_sx_sy
-
-        self.gm[self.current_grid].active = self.radioButton_active.isChecked()
-        self.gm[self.current_grid].size = [self.spinBox_rows.value(),
-                                           self.spinBox_cols.value()]
-        self.gm[self.current_grid].frame_size_selector = (
-            self.comboBox_tileSize.currentIndex())
-        tile_width_p = self.gm[self.current_grid].tile_width_p()
+            prev_grid_centre = grid.centre_sx_sy
+
+        grid.active = self.radioButton_active.isChecked()
+        grid.size = [self.spinBox_rows.value(), self.spinBox_cols.value()]
+        grid.frame_size_selector = self.comboBox_tileSize.currentIndex()
+        tile_width_p = grid.tile_width_p()
         input_overlap = self.spinBox_overlap.value()
         input_shift = self.spinBox_shift.value()
         if -0.3 * tile_width_p <= input_overlap < 0.3 * tile_width_p:
-            self.gm[self.current_grid].overlap = input_overlap
+            grid.overlap = input_overlap
         else:
             error_msg = ('Overlap outside of allowed '
                          'range (-30% .. 30% frame width).')
-        self.gm[self.current_grid].rotation = (
-            self.doubleSpinBox_rotation.value())
+        grid.rotation = self.doubleSpinBox_rotation.value()
         if 0 <= input_shift <= tile_width_p:
-            self.gm[self.current_grid].row_shift = input_shift
+            grid.row_shift = input_shift
         else:
             error_msg = ('Row shift outside of allowed '
                          'range (0 .. frame width).')
-        self.gm[self.current_grid].display_colour = (
-            self.comboBox_colourSelector.currentIndex())
-        self.gm[self.current_grid].use_wd_gradient = (
-            self.checkBox_focusGradient.isChecked())
+        grid.display_colour = self.comboBox_colourSelector.currentIndex()
+        grid.use_wd_gradient = self.checkBox_focusGradient.isChecked()
         if self.checkBox_focusGradient.isChecked():
-            self.gm[self.current_grid].calculate_wd_gradient()
+            grid.calculate_wd_gradient()
         # Acquisition parameters:
-        self.gm[self.current_grid].pixel_size = (
-            self.doubleSpinBox_pixelSize.value())
-        self.gm[self.current_grid].dwell_time_selector = (
-            self.comboBox_dwellTime.currentIndex())
-        self.gm[self.current_grid].acq_interval = (
-            self.spinBox_acqInterval.value())
-        self.gm[self.current_grid].acq_interval_offset = (
-            self.spinBox_acqIntervalOffset.value())
+        grid.pixel_size = self.doubleSpinBox_pixelSize.value()
+        grid.dwell_time_selector = self.comboBox_dwellTime.currentIndex()
+        grid.acq_interval = self.spinBox_acqInterval.value()
+        grid.acq_interval_offset = self.spinBox_acqIntervalOffset.value()
         if self.magc_mode:
-            self.gm[self.current_grid].centre_sx_sy = prev_grid_centre
+            grid.centre_sx_sy = prev_grid_centre
             self.gm.update_source_ROIs_from_grids()
         # Finally, recalculate tile positions
-        self.gm[self.current_grid].update_tile_positions()
+        grid.update_tile_positions()
         # Restore default behaviour for updating tile positions
-        self.gm[self.current_grid].auto_update_tile_positions = True
+        grid.auto_update_tile_positions = True
         if error_msg:
             QMessageBox.warning(self, 'Error', error_msg, QMessageBox.Ok)
         else:
-            self.main_controls_trigger.transmit('GRID SETTINGS CHANGED')
+            self.notify_main_controls()
 
     def open_focus_gradient_dlg(self):
         sub_dialog = FocusGradientSettingsDlg(self.gm, self.current_grid)
@@ -1192,79 +1588,74 @@ class FocusGradientSettingsDlg(QDialog):
         super().__init__()
         self.gm = gm
         self.current_grid = current_grid
+        # Several selector changes in quick succession result in a single
+        # calculation of the gradient.
+        self.gradient_timer = QTimer(self)
+        self.gradient_timer.setSingleShot(True)
+        self.gradient_timer.setInterval(25)
+        self.gradient_timer.timeout.connect(self.calculate_gradient)
         loadUi('..\\gui\\wd_gradient_settings_dlg.ui', self)
+        _disable_keyboard_tracking(self)
         self.setWindowModality(Qt.ApplicationModal)
-        self.setWindowIcon(QIcon('..\\img\\icon_16px.ico'))
+        self.setWindowIcon(_icon('..\\img\\icon_16px.ico'))
         self.setFixedSize(self.size())
         self.show()
         self.lineEdit_currentGrid.setText('Grid ' + str(current_grid))
-        self.grid_illustration.setPixmap(QPixmap('..\\img\\grid.png'))
+        self.grid_illustration.setPixmap(_pixmap('..\\img\\grid.png'))
         self.ref_tiles = self.gm[self.current_grid].wd_gradient_ref_tiles
         # Backup variable for currently selected reference tiles:
         self.prev_ref_tiles = self.ref_tiles.copy()
         # Set up tile selectors for the reference tiles:
         number_of_tiles = self.gm[self.current_grid].number_tiles
-        tile_list_str = ['-']
-        for tile in range(number_of_tiles):
-            tile_list_str.append(str(tile))
+        tile_list_str = ['-'] + [str(tile) for tile in range(number_of_tiles)]
         for i in range(3):
             if self.ref_tiles[i] >= number_of_tiles:
                 self.ref_tiles[i] = -1
-
-        self.comboBox_tileUpperLeft.blockSignals(True)
-        self.comboBox_tileUpperLeft.addItems(tile_list_str)
-        self.comboBox_tileUpperLeft.setCurrentIndex(self.ref_tiles[0] + 1)
-        self.comboBox_tileUpperLeft.currentIndexChanged.connect(
-            self.update_settings)
-        self.comboBox_tileUpperLeft.blockSignals(False)
-
-        self.comboBox_tileUpperRight.blockSignals(True)
-        self.comboBox_tileUpperRight.addItems(tile_list_str)
-        self.comboBox_tileUpperRight.setCurrentIndex(self.ref_tiles[1] + 1)
-        self.comboBox_tileUpperRight.currentIndexChanged.connect(
-            self.update_settings)
-        self.comboBox_tileUpperRight.blockSignals(False)
-
-        self.comboBox_tileLowerLeft.blockSignals(True)
-        self.comboBox_tileLowerLeft.addItems(tile_list_str)
-        self.comboBox_tileLowerLeft.setCurrentIndex(self.ref_tiles[2] + 1)
-        self.comboBox_tileLowerLeft.currentIndexChanged.connect(
-            self.update_settings)
-        self.comboBox_tileLowerLeft.blockSignals(False)
+        # The three selectors share a single model with the tile list
+        tile_list_model = QStringListModel(tile_list_str, self)
+        tile_selectors = (self.comboBox_tileUpperLeft,
+                          self.comboBox_tileUpperRight,
+                          self.comboBox_tileLowerLeft)
+        for selector, ref_tile in zip(tile_selectors, self.ref_tiles):
+            selector.blockSignals(True)
+            selector.setModel(tile_list_model)
+            selector.setCurrentIndex(ref_tile + 1)
+            selector.currentIndexChanged.connect(self.update_settings)
+            selector.blockSignals(False)
 
         self.update_settings()
+        self.calculate_gradient()
 
     def update_settings(self):
-        """Get selected working distances and calculate origin WD and
-        gradient if possible.
+        """Get selected working distances and schedule the calculation of
+        the origin WD and gradient.
         """
-        self.ref_tiles[0] = self.comboBox_tileUpperLeft.currentIndex() - 1
-        self.ref_tiles[1] = self.comboBox_tileUpperRight.currentIndex() - 1
-        self.ref_tiles[2] = self.comboBox_tileLowerLeft.currentIndex() - 1
-
-        if self.ref_tiles[0] >= 0:
-            self.label_t1.setText('Tile ' + str(self.ref_tiles[0]) + ':')
-            wd = self.gm[self.current_grid][self.ref_tiles[0]].wd
-            self.doubleSpinBox_t1.setValue(wd * 1000)
-        else:
-            self.label_t1.setText('Tile (-) :')
-            self.doubleSpinBox_t1.setValue(0)
-        if self.ref_tiles[1] >= 0:
-            self.label_t2.setText('Tile ' + str(self.ref_tiles[1]) + ':')
-            wd = self.gm[self.current_grid][self.ref_tiles[1]].wd
-            self.doubleSpinBox_t2.setValue(wd * 1000)
-        else:
-            self.label_t2.setText('Tile (-) :')
-            self.doubleSpinBox_t2.setValue(0)
-        if self.ref_tiles[2] >= 0:
-            self.label_t3.setText('Tile ' + str(self.ref_tiles[2]) + ':')
-            wd = self.gm[self.current_grid][self.ref_tiles[2]].wd
-            self.doubleSpinBox_t3.setValue(wd * 1000)
-        else:
-            self.label_t3.setText('Tile (-) :')
-            self.doubleSpinBox_t3.setValue(0)
+        grid = self.gm[self.current_grid]
+        selectors = (self.comboBox_tileUpperLeft,
+                     self.comboBox_tileUpperRight,
+                     self.comboBox_tileLowerLeft)
+        labels = (self.label_t1, self.label_t2, self.label_t3)
+        spinboxes = (self.doubleSpinBox_t1,
+                     self.doubleSpinBox_t2,
+                     self.doubleSpinBox_t3)
+        for i, (selector, label, spinbox) in enumerate(
+                zip(selectors, labels, spinboxes)):
+            tile_index = selector.currentIndex() - 1
+            self.ref_tiles[i] = tile_index
+            if tile_index >= 0:
+                label.setText(f'Tile {tile_index}:')
+                spinbox.setValue(grid[tile_index].wd * 1000)
+            else:
+                label.setText('Tile (-) :')
+                spinbox.setValue(0)
+
+        grid.wd_gradient_ref_tiles = self.ref_tiles
+        # (Re)start the timer, calculate_gradient() is called when it expires
+        self.gradient_timer.start()
 
-        self.gm[self.current_grid].wd_gradient_ref_tiles = self.ref_tiles
+    def calculate_gradient(self):
+        """Calculate origin WD and gradient if possible."""
+        self.gradient_timer.stop()
         # Try to calculate focus map:
         self.success = self.gm[self.current_grid].calculate_wd_gradient()
         if self.success:
@@ -1281,6 +1672,9 @@ class FocusGradientSettingsDlg(QDialog):
         self.textEdit_originGradients.setText(current_status_str)
 
     def accept(self):
+        if self.gradient_timer.isActive():
+            # Calculate now for the current selection
+            self.calculate_gradient()
         if self.success:
             super().accept()
         else:
@@ -1291,6 +1685,7 @@ class FocusGradientSettingsDlg(QDialog):
                  QMessageBox.Ok)
 
     def reject(self):
+        self.gradient_timer.stop()
         # Restore previous selection:
         self.gm[self.current_grid].wd_gradient_ref_tiles = self.prev_ref_tiles
         # Recalculate with previous setting:
@@ -1307,16 +1702,23 @@ class AcqSettingsDlg(QDialog):
         self.acq = acquisition
         self.notifications = notifications
         loadUi('..\\gui\\acq_settings_dlg.ui', self)
+        _disable_keyboard_tracking(self)
         self.setWindowModality(Qt.ApplicationModal)
-        self.setWindowIcon(QIcon('..\\img\\icon_16px.ico'))
+        self.setWindowIcon(_icon('..\\img\\icon_16px.ico'))
         self.setFixedSize(self.size())
         self.show()
         self.pushButton_selectDir.clicked.connect(self.select_directory)
-        self.pushButton_selectDir.setIcon(QIcon('..\\img\\selectdir.png'))
+        self.pushButton_selectDir.setIcon(_icon('..\\img\\selectdir.png'))
         self.pushButton_selectDir.setIconSize(QSize(16, 16))
         # Display current settings:
         self.lineEdit_baseDir.setText(self.acq.base_dir)
-        self.lineEdit_baseDir.textChanged.connect(self.update_stack_name)
+        # The stack name is updated after typing has paused for 100 ms
+        self.stack_name_timer = QTimer(self)
+        self.stack_name_timer.setSingleShot(True)
+        self.stack_name_timer.setInterval(100)
+        self.stack_name_timer.timeout.connect(self.update_stack_name)
+        self.lineEdit_baseDir.textChanged.connect(
+            self.schedule_stack_name_update)
         self.update_stack_name()
         self.new_base_dir = ''
         self.spinBox_sliceThickness.setValue(self.acq.slice_thickness)
@@ -1337,6 +1739,10 @@ class AcqSettingsDlg(QDialog):
         if not use_microtome:
             self.spinBox_sliceThickness.setEnabled(False)
             self.doubleSpinBox_zDiff.setEnabled(False)
+        # The workspace directory is tested in a thread (see accept())
+        self.busy = False
+        self.workspace_check_trigger = utils.Trigger()
+        self.workspace_check_trigger.signal.connect(self.finish_accept)
 
     def select_directory(self):
         """Let user select the base directory for the stack acquisition.
@@ -1347,27 +1753,36 @@ class AcqSettingsDlg(QDialog):
             start_path = self.acq.base_dir[:3]
         else:
             start_path = 'C:\\'
-        self.lineEdit_baseDir.setText(
-            str(QFileDialog.getExistingDirectory(
-                self, 'Select Directory',
-                start_path,
-                QFileDialog.ShowDirsOnly)).replace('/', '\\'))
+        selected_dir = str(QFileDialog.getExistingDirectory(
+            self, 'Select Directory',
+            start_path,
+            QFileDialog.ShowDirsOnly))
+        if selected_dir:
+            # Convert forward slashes to backslashes
+            selected_dir = os.path.normpath(selected_dir)
+        self.lineEdit_baseDir.setText(selected_dir)
 
     def update_server_lineedit(self):
         self.lineEdit_projectName.setEnabled(
             self.checkBox_sendMetaData.isChecked())
 
+    def schedule_stack_name_update(self):
+        # (Re)start the timer, update_stack_name() is called when it expires
+        self.stack_name_timer.start()
+
     def update_stack_name(self):
-        base_dir = self.lineEdit_baseDir.text().rstrip(r'\/ ')
-        self.label_stackName.setText(base_dir[base_dir.rfind('\\') + 1:])
+        self.stack_name_timer.stop()
+        self.label_stackName.setText(os.path.basename(
+            self.lineEdit_baseDir.text().rstrip(r'\/ ')))
 
     def accept(self):
-        success = True
+        if self.busy:
+            # Directory check still in progress
+            return
         selected_dir = self.lineEdit_baseDir.text()
-        # Remove trailing slashes and whitespace
-        modified_dir = selected_dir.rstrip(r'\/ ')
-        # Replace spaces and forward slashes
-        modified_dir = modified_dir.replace(' ', '_').replace('/', '\\')
+        # Remove trailing slashes and whitespace, replace spaces and forward
+        # slashes
+        modified_dir = selected_dir.rstrip(r'\/ ').translate(_BASE_DIR_TRANS)
         # Notify user if directory was modified
         if modified_dir != selected_dir:
             self.lineEdit_baseDir.setText(modified_dir)
@@ -1378,30 +1793,47 @@ class AcqSettingsDlg(QDialog):
                 'trailing slashes and whitespace and replacing spaces with '
                 'underscores and forward slashes with backslashes.',
                 QMessageBox.Ok)
+        self.modified_dir = modified_dir
         # Check if path contains a drive letter
-        reg = re.compile('^[a-zA-Z]:\\\$')
-        if not reg.match(modified_dir[:3]):
-            success = False
+        if not _DRIVE_LETTER_RE.match(modified_dir[:3]):
             QMessageBox.warning(
                 self, 'Error',
                 'Please specify the full path to the base directory. It '
                 'must begin with a drive letter, for example: "D:\\..."',
                 QMessageBox.Ok)
+            self.finish_accept(dir_ok=False)
         else:
-            # If workspace directory does not yet exist, create it to test
-            # whether path is valid and accessible
-            workspace_dir = os.path.join(modified_dir, 'workspace')
-            try:
-                if not os.path.exists(workspace_dir):
-                    os.makedirs(workspace_dir)
-            except Exception as e:
-                success = False
+            # Test whether the path is valid and accessible in a thread,
+            # because this may take a while on network drives. The
+            # remaining settings are processed in finish_accept().
+            self.busy = True
+            self.buttonBox.setEnabled(False)
+            self.workspace_error = None
+            threading.Thread(target=self.workspace_check_thread).start()
+
+    def workspace_check_thread(self):
+        """If the workspace directory does not yet exist, create it to test
+        whether the base directory is valid and accessible."""
+        workspace_dir = os.path.join(self.modified_dir, 'workspace')
+        try:
+            if not os.path.exists(workspace_dir):
+                os.makedirs(workspace_dir)
+        except Exception as e:
+            self.workspace_error = str(e)
+        self.workspace_check_trigger.signal.emit()
+
+    def finish_accept(self, dir_ok=True):
+        if self.busy:
+            self.busy = False
+            self.buttonBox.setEnabled(True)
+            if self.workspace_error is not None:
+                dir_ok = False
                 QMessageBox.warning(
                     self, 'Error',
                     'The selected base directory is invalid or '
-                    'inaccessible: ' + str(e),
+                    'inaccessible: ' + self.workspace_error,
                     QMessageBox.Ok)
-
+        success = dir_ok
         if 5 <= self.spinBox_sliceThickness.value() <= 200:
             self.acq.slice_thickness = self.spinBox_sliceThickness.value()
         number_slices = self.spinBox_numberSlices.value()
@@ -1413,6 +1845,7 @@ class AcqSettingsDlg(QDialog):
         self.acq.eht_off_after_stack = self.checkBox_EHTOff.isChecked()
         self.acq.send_metadata = self.checkBox_sendMetaData.isChecked()
         if self.checkBox_sendMetaData.isChecked():
+            import validators
             metadata_server_url = self.lineEdit_metaDataServer.text()
             if not validators.url(metadata_server_url):
                 QMessageBox.warning(
@@ -1429,9 +1862,14 @@ class AcqSettingsDlg(QDialog):
                 'target number of slices.', QMessageBox.Ok)
             success = False
         if success:
-            self.acq.base_dir = modified_dir
+            self.acq.base_dir = self.modified_dir
             super().accept()
 
+    def reject(self):
+        # Do not close the dialog while the directory check is in progress
+        if not self.busy:
+            super().reject()
+
 # ------------------------------------------------------------------------------
 
 class PreStackDlg(QDialog):
@@ -1447,9 +1885,9 @@ class PreStackDlg(QDialog):
         self.microtome = microtome
         loadUi('..\\gui\\pre_stack_dlg.ui', self)
         self.setWindowModality(Qt.ApplicationModal)
-        self.setWindowIcon(QIcon('..\\img\\icon_16px.ico'))
+        self.setWindowIcon(_icon('..\\img\\icon_16px.ico'))
         self.setFixedSize(self.size())
-        self.show()
+        blocked_widgets = _block_widget_signals(self)
         # Different labels if stack is paused ('Continue' instead of 'Start')
         if acq.acq_paused:
             self.pushButton_startAcq.setText('Continue acquisition')
@@ -1501,6 +1939,8 @@ class PreStackDlg(QDialog):
         self.doubleSpinBox_contrast.setValue(self.sem.bsd_contrast)
         self.spinBox_bias.setValue(self.sem.bsd_bias)
         self.checkBox_oscillation.setChecked(self.microtome.use_oscillation)
+        _unblock_widget_signals(blocked_widgets)
+        self.show()
 
     def accept(self):
         # Save updated settings
@@ -1528,7 +1968,7 @@ class PauseDlg(QDialog):
         super().__init__()
         loadUi('..\\gui\\pause_dlg.ui', self)
         self.setWindowModality(Qt.ApplicationModal)
-        self.setWindowIcon(QIcon('..\\img\\icon_16px.ico'))
+        self.setWindowIcon(_icon('..\\img\\icon_16px.ico'))
         self.setFixedSize(self.size())
         self.show()
         self.pause_type = 0  # don't pause (when user clicks 'Cancel')
@@ -1556,58 +1996,92 @@ class ExportDlg(QDialog):
         self.acq = acq
         loadUi('..\\gui\\export_dlg.ui', self)
         self.setWindowModality(Qt.ApplicationModal)
-        self.setWindowIcon(QIcon('..\\img\\icon_16px.ico'))
+        self.setWindowIcon(_icon('..\\img\\icon_16px.ico'))
         self.setFixedSize(self.size())
         self.pushButton_export.clicked.connect(self.export_list)
         self.spinBox_untilSlice.setValue(int(self.acq.slice_counter))
+        # List of imagelist files from the last export, and the directory
+        # (with its modification time) in which they were found
+        self.imagelist_files = []
+        self.imagelist_files_key = None
+        # The export runs in a thread (see export_list())
+        self.busy = False
+        self.export_progress_trigger = utils.Trigger()
+        self.export_progress_trigger.signal.connect(self.show_export_progress)
+        self.export_finish_trigger = utils.Trigger()
+        self.export_finish_trigger.signal.connect(self.finish_export)
         self.show()
 
+    def get_imagelist_files(self, logs_dir):
+        """Return the sorted list of imagelist files in logs_dir. The
+        directory is only searched again if it has been modified since the
+        previous call.
+        """
+        try:
+            dir_mtime = os.stat(logs_dir).st_mtime_ns
+        except OSError:
+            return []
+        if (logs_dir, dir_mtime) != self.imagelist_files_key:
+            self.imagelist_files = sorted(
+                glob.glob(os.path.join(logs_dir, 'imagelist*.txt')))
+            self.imagelist_files_key = (logs_dir, dir_mtime)
+        return self.imagelist_files
+
     def export_list(self):
+        """Start the export in a thread. The export button shows the
+        progress, finish_export() is called when the export is done.
+        """
+        self.busy = True
         self.pushButton_export.setText('Busy')
         self.pushButton_export.setEnabled(False)
-        QApplication.processEvents()
-        base_dir = self.acq.base_dir
-        target_grid_index = str(
-            self.spinBox_gridNumber.value()).zfill(utils.GRID_DIGITS)
-        pixel_size = self.doubleSpinBox_pixelSize.value()
-        start_slice = self.spinBox_fromSlice.value()
-        end_slice = self.spinBox_untilSlice.value()
-        # Read all imagelist files into memory
-        imagelist_str = []
-        imagelist_data = []
-        file_list = glob.glob(
-            os.path.join(base_dir, 'meta', 'logs', 'imagelist*.txt'))
-        file_list.sort()
-        for file in file_list:
-            with open(file) as f:
-                imagelist_str.extend(f.readlines())
-        if len(imagelist_str) > 0:
-            # split strings, store entries in variables, find minimum x and y
-            min_x = 1000000
-            min_y = 1000000
-            for line in imagelist_str:
-                elements = line.split(';')
-                # elements[0]: relative path to tile image
-                # elements[1]: x coordinate in nm
-                # elements[2]: y coordinate in nm
-                # elements[3]: z coordinate in nm
-                # elements[4]: slice number
-                slice_number = int(elements[4])
-                grid_index = elements[0][7:11]
-                if (start_slice <= slice_number <= end_slice
-                    and grid_index == target_grid_index):
-                    x = int(int(elements[1]) / pixel_size)
-                    if x < min_x:
-                        min_x = x
-                    y = int(int(elements[2]) / pixel_size)
-                    if y < min_y:
-                        min_y = y
-                    imagelist_data.append([elements[0], x, y, slice_number])
-            # Subtract minimum values to obtain bounding box with (0, 0) as
+        self.export_settings = (
+            self.acq.base_dir,
+            str(self.spinBox_gridNumber.value()).zfill(utils.GRID_DIGITS),
+            self.doubleSpinBox_pixelSize.value(),
+            self.spinBox_fromSlice.value(),
+            self.spinBox_untilSlice.value())
+        threading.Thread(target=self.export_thread).start()
+
+    def export_thread(self):
+        import numpy as np
+        (base_dir, target_grid_index, pixel_size,
+         start_slice, end_slice) = self.export_settings
+        logs_dir = os.path.join(base_dir, 'meta', 'logs')
+        file_list = self.get_imagelist_files(logs_dir)
+        self.files_total = len(file_list)
+        try:
+            # The entries parsed in a previous export are used again if the
+            # imagelist files have not changed since then.
+            file_stamps = [(file, os.stat(file).st_mtime_ns)
+                           for file in file_list]
+            cache_key = (logs_dir, target_grid_index)
+            cached = _imagelist_cache.get(cache_key)
+            if cached is not None and cached[0] == file_stamps:
+                entries = cached[1]
+            else:
+                entries = self.read_imagelists(file_list, target_grid_index)
+                _imagelist_cache[cache_key] = (file_stamps, entries)
+        except Exception as e:
+            self.export_result = (
+                False, 'An error ocurred while reading the image metadata: '
+                + str(e))
+            self.export_finish_trigger.signal.emit()
+            return
+        metadata_found, tile_paths, coords, slice_numbers = entries
+        if metadata_found:
+            # Select the entries in the slice range
+            selected = (start_slice <= slice_numbers) & (
+                slice_numbers <= end_slice)
+            tile_paths = tile_paths[selected].tolist()
+            slice_numbers = slice_numbers[selected].tolist()
+            # Convert coordinates to pixels (truncated like int()), and
+            # subtract minimum values to obtain bounding box with (0, 0) as
             # origin in top-left corner.
-            for item in imagelist_data:
-                item[1] -= min_x
-                item[2] -= min_y
+            coords = (coords[:, selected] / pixel_size).astype(np.int64)
+            if coords.size > 0:
+                coords -= coords.min(axis=1, keepdims=True)
+            imagelist_data = zip(tile_paths, coords[0].tolist(),
+                                 coords[1].tolist(), slice_numbers)
             # Write to output file
             try:
                 output_file = os.path.join(base_dir,
@@ -1617,33 +2091,96 @@ class ExportDlg(QDialog):
                                            + str(end_slice)
                                            + '.txt')
                 with open(output_file, 'w') as f:
-                    for item in imagelist_data:
-                        f.write(item[0] + '\t'
-                                + str(item[1]) + '\t'
-                                + str(item[2]) + '\t'
-                                + str(item[3]) + '\n')
+                    f.writelines(
+                        f'{path}\t{x}\t{y}\t{slice_number}\n'
+                        for path, x, y, slice_number in imagelist_data)
             except Exception as e:
-                QMessageBox.warning(
-                    self, 'Error',
-                    'An error ocurred while writing the output file: ' + str(e),
-                    QMessageBox.Ok)
+                self.export_result = (
+                    False,
+                    'An error ocurred while writing the output file: ' + str(e))
             else:
-                QMessageBox.information(
-                    self, 'Export completed',
-                    f'A total of {len(imagelist_data)} tile entries were '
+                self.export_result = (
+                    True,
+                    f'A total of {len(tile_paths)} tile entries were '
                     f'processed.\n\nThe output file\n'
                     f'trakem2_imagelist_slice{start_slice}to{end_slice}.txt\n'
                     f'was written to the current base directory\n'
-                    f'{base_dir}.',
-                    QMessageBox.Ok)
+                    f'{base_dir}.')
         else:
-            QMessageBox.warning(
-                self, 'Error',
-                'No image metadata found.',
-                QMessageBox.Ok)
+            self.export_result = (False, 'No image metadata found.')
+        self.export_finish_trigger.signal.emit()
+
+    def read_imagelists(self, file_list, target_grid_index):
+        """Read all entries for the target grid from the imagelist files.
+        Return whether any metadata was found, the tile paths, the x and y
+        coordinates in nm (as a 2×N array), and the slice numbers.
+        """
+        import numpy as np
+        # Entries: tile paths, x and y coordinates in nm (as strings,
+        # converted in bulk below), and slice numbers (as a typed array of
+        # C ints instead of a list of int objects)
+        tile_paths = []
+        x_coords = []
+        y_coords = []
+        slice_numbers = array.array('i')
+        # All lines for the target grid begin with this relative path
+        grid_dir = os.path.join('tiles', 'g' + target_grid_index, '')
+        # Read the imagelist files one by one
+        metadata_found = False
+        for file_number, file in enumerate(file_list, 1):
+            # The files are read from start to end: tell the OS, so that
+            # it can read ahead, and use a large buffer.
+            fd = os.open(file, os.O_RDONLY | _O_SEQUENTIAL)
+            with open(fd, buffering=1 << 20) as f:
+                imagelist = f.read()
+            if imagelist:
+                metadata_found = True
+            # Only files with entries for the target grid are parsed
+            if grid_dir in imagelist:
+                for line in imagelist.splitlines():
+                    # The grid index is at a fixed position in the relative
+                    # path at the beginning of the line. Skip lines for other
+                    # grids before splitting them.
+                    if line[7:11] != target_grid_index:
+                        continue
+                    elements = line.split(';')
+                    # elements[0]: relative path to tile image
+                    # elements[1]: x coordinate in nm
+                    # elements[2]: y coordinate in nm
+                    # elements[3]: z coordinate in nm
+                    # elements[4]: slice number
+                    tile_paths.append(elements[0])
+                    x_coords.append(elements[1])
+                    y_coords.append(elements[2])
+                    slice_numbers.append(int(elements[4]))
+            self.files_processed = file_number
+            self.export_progress_trigger.signal.emit()
+        # Parse all coordinates in one step
+        coords = np.array([x_coords, y_coords], dtype=str).astype(np.int64)
+        return (metadata_found,
+                np.array(tile_paths, dtype=object),
+                coords,
+                np.asarray(slice_numbers, dtype=np.int64))
+
+    def show_export_progress(self):
+        self.pushButton_export.setText(
+            f'Busy {self.files_processed}/{self.files_total}')
+
+    def finish_export(self):
+        self.busy = False
+        success, message = self.export_result
+        if success:
+            QMessageBox.information(
+                self, 'Export completed', message, QMessageBox.Ok)
+        else:
+            QMessageBox.warning(self, 'Error', message, QMessageBox.Ok)
         self.pushButton_export.setText('Export')
         self.pushButton_export.setEnabled(True)
-        QApplication.processEvents()
+
+    def reject(self):
+        # Dialog cannot be closed while export is running
+        if not self.busy:
+            super().reject()
 
 # ------------------------------------------------------------------------------
 
@@ -1654,53 +2191,78 @@ class UpdateDlg(QDialog):
         super().__init__()
         loadUi('..\\gui\\update_dlg.ui', self)
         self.setWindowModality(Qt.ApplicationModal)
-        self.setWindowIcon(QIcon('..\\img\\icon_16px.ico'))
+        self.setWindowIcon(_icon('..\\img\\icon_16px.ico'))
         self.setFixedSize(self.size())
         self.pushButton_update.clicked.connect(self.update)
+        # The update runs in a thread (see update())
+        self.busy = False
+        self.update_finish_trigger = utils.Trigger()
+        self.update_finish_trigger.signal.connect(self.finish_update)
         self.show()
 
     def update(self):
+        """Start the download and installation of the current version in a
+        thread. finish_update() is called when the update is done.
+        """
+        self.busy = True
         self.pushButton_update.setText('Busy')
         self.pushButton_update.setEnabled(False)
-        QApplication.processEvents()
+        threading.Thread(target=self.update_thread).start()
+
+    def update_thread(self):
+        from zipfile import ZipFile
         url = "https://github.com/SBEMimage/SBEMimage/archive/master.zip"
         try:
-            response = requests.get(url, stream=True)
-            with open('master.zip', 'wb') as file:
-                shutil.copyfileobj(response.raw, file)
+            # Download the archive into memory in chunks of 1 MiB
+            response = _get_github_session().get(url, stream=True)
+            archive = io.BytesIO()
+            for chunk in response.iter_content(chunk_size=1 << 20):
+                archive.write(chunk)
             del response
         except:
-            QMessageBox.warning(
-                self, 'Error',
+            self.update_result = (
+                False,
                 'Could not download current version from GitHub. Check your '
-                'internet connection. ',
-                QMessageBox.Ok)
+                'internet connection. ')
         else:
             # Get directory of current installation
             install_path = os.path.dirname(
                 os.path.dirname(os.path.abspath(__file__)))
             try:
-                with ZipFile("master.zip", "r") as zip_object:
+                with ZipFile(archive, "r") as zip_object:
                     for zip_info in zip_object.infolist():
                         if zip_info.filename[-1] == '/':
                             continue
-                        # Remove string 'SBEMimage-master/'
-                        zip_info.filename = zip_info.filename[17:]
-                        print(zip_info.filename)
+                        # Remove top-level folder 'SBEMimage-master/'
+                        zip_info.filename = zip_info.filename.partition(
+                            '/')[2]
                         zip_object.extract(zip_info, install_path)
             except:
-                QMessageBox.warning(
-                self, 'Error',
-                'Could not extract downloaded GitHub archive.',
-                QMessageBox.Ok)
+                self.update_result = (
+                    False, 'Could not extract downloaded GitHub archive.')
             else:
-                QMessageBox.information(
-                self, 'Update complete',
-                'SBEMimage was updated to the most recent version. '
-                'You must restart the program to use the updated version.',
-                QMessageBox.Ok)
-                self.pushButton_update.setText('Update now')
-                self.pushButton_update.setEnabled(True)
+                self.update_result = (
+                    True,
+                    'SBEMimage was updated to the most recent version. '
+                    'You must restart the program to use the updated '
+                    'version.')
+        self.update_finish_trigger.signal.emit()
+
+    def finish_update(self):
+        self.busy = False
+        success, message = self.update_result
+        if success:
+            QMessageBox.information(
+                self, 'Update complete', message, QMessageBox.Ok)
+        else:
+            QMessageBox.warning(self, 'Error', message, QMessageBox.Ok)
+        self.pushButton_update.setText('Update now')
+        self.pushButton_update.setEnabled(True)
+
+    def reject(self):
+        # Dialog cannot be closed while update is running
+        if not self.busy:
+            super().reject()
 
 # ------------------------------------------------------------------------------
 
@@ -1709,54 +2271,60 @@ class EmailMonitoringSettingsDlg(QDialog):
     options, and remote control through e-mail commands.
     """
 
+    # Settings shown in spin boxes and check boxes: (attribute, widget)
+    NOTIFICATION_SETTINGS = (
+        ('send_logfile', 'checkBox_sendLogFile'),
+        ('send_additional_logs', 'checkBox_sendIncidentLogFile'),
+        ('send_viewport_screenshot', 'checkBox_sendViewport'),
+        ('send_ov', 'checkBox_sendOverviews'),
+        ('send_tiles', 'checkBox_sendTiles'),
+        ('send_ov_reslices', 'checkBox_sendOVReslices'),
+        ('send_tile_reslices', 'checkBox_sendTileReslices'),
+        ('remote_commands_enabled', 'checkBox_allowEmailControl'))
+    ACQ_SETTINGS = (
+        ('status_report_interval', 'spinBox_reportInterval'),
+        ('remote_check_interval', 'spinBox_remoteCheckInterval'))
+
     def __init__(self, acquisition, notifications):
         super().__init__()
         self.acq = acquisition
         self.notifications = notifications
         loadUi('..\\gui\\email_monitoring_settings_dlg.ui', self)
         self.setWindowModality(Qt.ApplicationModal)
-        self.setWindowIcon(QIcon('..\\img\\icon_16px.ico'))
+        self.setWindowIcon(_icon('..\\img\\icon_16px.ico'))
         self.setFixedSize(self.size())
-        self.show()
+        blocked_widgets = _block_widget_signals(self)
+        notifications = self.notifications
         self.lineEdit_notificationEmail.setText(
-            self.notifications.user_email_addresses[0])
+            notifications.user_email_addresses[0])
         self.lineEdit_secondaryNotificationEmail.setText(
-            self.notifications.user_email_addresses[1])
-        self.spinBox_reportInterval.setValue(self.acq.status_report_interval)
-        self.lineEdit_selectedOV.setText(str(
-            self.notifications.status_report_ov_list)[1:-1])
-        self.lineEdit_selectedTiles.setText(str(
-            self.notifications.status_report_tile_list)[1:-1].replace('\'', ''))
-        self.checkBox_sendLogFile.setChecked(self.notifications.send_logfile)
-        self.checkBox_sendIncidentLogFile.setChecked(
-            self.notifications.send_additional_logs)
-        self.checkBox_sendViewport.setChecked(
-            self.notifications.send_viewport_screenshot)
-        self.checkBox_sendOverviews.setChecked(self.notifications.send_ov)
+            notifications.user_email_addresses[1])
+        # The lists as shown. They only have to be validated again in
+        # accept() if they have been edited.
+        self.ov_list_str = str(notifications.status_report_ov_list)[1:-1]
+        self.tile_list_str = str(
+            notifications.status_report_tile_list)[1:-1].replace('\'', '')
+        self.lineEdit_selectedOV.setText(self.ov_list_str)
+        self.lineEdit_selectedTiles.setText(self.tile_list_str)
+        _show_settings(self, notifications, self.NOTIFICATION_SETTINGS)
+        _show_settings(self, self.acq, self.ACQ_SETTINGS)
         self.checkBox_sendOverviews.stateChanged.connect(
             self.update_ov_list_input)
-        self.checkBox_sendTiles.setChecked(self.notifications.send_tiles)
         self.checkBox_sendTiles.stateChanged.connect(
             self.update_tile_list_input)
-        self.checkBox_sendOVReslices.setChecked(
-            self.notifications.send_ov_reslices)
         self.checkBox_sendOVReslices.stateChanged.connect(
             self.update_ov_list_input)
-        self.checkBox_sendTileReslices.setChecked(
-            self.notifications.send_tile_reslices)
         self.checkBox_sendTileReslices.stateChanged.connect(
             self.update_tile_list_input)
-        self.checkBox_allowEmailControl.setChecked(
-            self.notifications.remote_commands_enabled)
         self.checkBox_allowEmailControl.stateChanged.connect(
             self.update_remote_option_input)
         self.update_remote_option_input()
-        self.spinBox_remoteCheckInterval.setValue(
-            self.acq.remote_check_interval)
-        self.lineEdit_account.setText(self.notifications.email_account)
+        self.lineEdit_account.setText(notifications.email_account)
         # Show password as string of asterisks
         self.lineEdit_password.setEchoMode(QLineEdit.Password)
-        self.lineEdit_password.setText(self.notifications.remote_cmd_email_pw)
+        self.lineEdit_password.setText(notifications.remote_cmd_email_pw)
+        _unblock_widget_signals(blocked_widgets)
+        self.show()
 
     def update_ov_list_input(self):
         self.lineEdit_selectedOV.setEnabled(
@@ -1774,54 +2342,42 @@ class EmailMonitoringSettingsDlg(QDialog):
         self.lineEdit_password.setEnabled(status)
 
     def accept(self):
+        from validate_email import validate_email
+        notifications = self.notifications
         error_str = ''
         email1 = self.lineEdit_notificationEmail.text()
         email2 = self.lineEdit_secondaryNotificationEmail.text()
         if validate_email(email1):
-            self.notifications.user_email_addresses[0] = email1
+            notifications.user_email_addresses[0] = email1
         else:
             error_str = (
                 'First user e-mail address incorrectly formatted or missing.')
         # Second user e-mail is optional
         if validate_email(email2) or not email2:
-            self.notifications.user_email_addresses[1] = (
+            notifications.user_email_addresses[1] = (
                 self.lineEdit_secondaryNotificationEmail.text())
         else:
             error_str = 'Second user e-mail address incorrectly formatted.'
-        self.acq.status_report_interval = self.spinBox_reportInterval.value()
 
-        success, ov_list = utils.validate_ov_list(
-            self.lineEdit_selectedOV.text())
-        if success:
-            self.notifications.status_report_ov_list = ov_list
-        else:
-            error_str = 'List of selected overviews incorrectly formatted.'
+        ov_list_str = self.lineEdit_selectedOV.text()
+        if ov_list_str != self.ov_list_str:
+            success, ov_list = utils.validate_ov_list(ov_list_str)
+            if success:
+                notifications.status_report_ov_list = ov_list
+            else:
+                error_str = 'List of selected overviews incorrectly formatted.'
 
-        success, tile_list = utils.validate_tile_list(
-            self.lineEdit_selectedTiles.text())
-        if success:
-            self.notifications.status_report_tile_list = tile_list
-        else:
-            error_str = 'List of selected tiles incorrectly formatted.'
-
-        self.notifications.send_logfile = self.checkBox_sendLogFile.isChecked()
-        self.notifications.send_additional_logs = (
-            self.checkBox_sendIncidentLogFile.isChecked())
-        self.notifications.send_viewport_screenshot = (
-            self.checkBox_sendViewport.isChecked())
-        self.notifications.send_ov = (
-            self.checkBox_sendOverviews.isChecked())
-        self.notifications.send_tiles = (
-            self.checkBox_sendTiles.isChecked())
-        self.notifications.send_ov_reslices = (
-            self.checkBox_sendOVReslices.isChecked())
-        self.notifications.send_tile_reslices = (
-            self.checkBox_sendTileReslices.isChecked())
-        self.notifications.remote_commands_enabled = (
-            self.checkBox_allowEmailControl.isChecked())
-        self.acq.remote_check_interval = (
-            self.spinBox_remoteCheckInterval.value())
-        self.notifications.remote_cmd_email_pw = self.lineEdit_password.text()
+        tile_list_str = self.lineEdit_selectedTiles.text()
+        if tile_list_str != self.tile_list_str:
+            success, tile_list = utils.validate_tile_list(tile_list_str)
+            if success:
+                notifications.status_report_tile_list = tile_list
+            else:
+                error_str = 'List of selected tiles incorrectly formatted.'
+
+        _store_settings(self, notifications, self.NOTIFICATION_SETTINGS)
+        _store_settings(self, self.acq, self.ACQ_SETTINGS)
+        notifications.remote_cmd_email_pw = self.lineEdit_password.text()
         if not error_str:
             super().accept()
         else:
@@ -1835,6 +2391,19 @@ class DebrisSettingsDlg(QDialog):
     max. sweep number reached.
     """
 
+    # Settings shown in spin boxes and check boxes: (attribute, widget)
+    OV_SETTINGS = (
+        ('auto_debris_area_margin', 'spinBox_debrisMargin'),
+        ('detection_area_visible', 'checkBox_showDebrisArea'))
+    ACQ_SETTINGS = (
+        ('max_number_sweeps', 'spinBox_maxSweeps'),
+        ('continue_after_max_sweeps', 'checkBox_continueAcq'))
+    INSPECTOR_SETTINGS = (
+        ('mean_diff_threshold', 'doubleSpinBox_diffMean'),
+        ('stddev_diff_threshold', 'doubleSpinBox_diffSD'),
+        ('histogram_diff_threshold', 'spinBox_diffHistogram'),
+        ('image_diff_threshold', 'spinBox_diffPixels'))
+
     def __init__(self, ovm, image_inspector, acq):
         super().__init__()
         self.ovm = ovm
@@ -1842,37 +2411,26 @@ class DebrisSettingsDlg(QDialog):
         self.acq = acq
         loadUi('..\\gui\\debris_settings_dlg.ui', self)
         self.setWindowModality(Qt.ApplicationModal)
-        self.setWindowIcon(QIcon('..\\img\\icon_16px.ico'))
+        self.setWindowIcon(_icon('..\\img\\icon_16px.ico'))
         self.setFixedSize(self.size())
-        self.show()
+        blocked_widgets = _block_widget_signals(self)
+        img_inspector = self.img_inspector
         # Detection area
         if self.ovm.use_auto_debris_area:
             self.radioButton_autoSelection.setChecked(True)
         else:
             self.radioButton_fullSelection.setChecked(True)
-        # Extra margin around detection area in pixels
-        self.spinBox_debrisMargin.setValue(
-            self.ovm.auto_debris_area_margin)
-        self.spinBox_maxSweeps.setValue(self.acq.max_number_sweeps)
-        self.doubleSpinBox_diffMean.setValue(
-            self.img_inspector.mean_diff_threshold)
-        self.doubleSpinBox_diffSD.setValue(
-            self.img_inspector.stddev_diff_threshold)
-        self.spinBox_diffHistogram.setValue(
-            self.img_inspector.histogram_diff_threshold)
-        self.spinBox_diffPixels.setValue(
-            self.img_inspector.image_diff_threshold)
-        self.checkBox_showDebrisArea.setChecked(
-            self.ovm.detection_area_visible)
-        self.checkBox_continueAcq.setChecked(
-            self.acq.continue_after_max_sweeps)
+        # Extra margin around detection area (in pixels), thresholds, etc.
+        _show_settings(self, self.ovm, self.OV_SETTINGS)
+        _show_settings(self, self.acq, self.ACQ_SETTINGS)
+        _show_settings(self, img_inspector, self.INSPECTOR_SETTINGS)
         # Detection methods
         self.radioButton_methodQuadrant.setChecked(
-            self.img_inspector.debris_detection_method == 0)
+            img_inspector.debris_detection_method == 0)
         self.radioButton_methodPixel.setChecked(
-            self.img_inspector.debris_detection_method == 1)
+            img_inspector.debris_detection_method == 1)
         self.radioButton_methodHistogram.setChecked(
-            self.img_inspector.debris_detection_method == 2)
+            img_inspector.debris_detection_method == 2)
         self.radioButton_methodQuadrant.toggled.connect(
             self.update_option_selection)
         self.radioButton_methodHistogram.toggled.connect(
@@ -1882,6 +2440,8 @@ class DebrisSettingsDlg(QDialog):
         # Button to reset moving averages
         self.pushButton_resetAvg.clicked.connect(
             self.reset_moving_averages)
+        _unblock_widget_signals(blocked_widgets)
+        self.show()
 
     def update_option_selection(self):
         """Let user only change the parameters for the currently selected
@@ -1924,28 +2484,18 @@ class DebrisSettingsDlg(QDialog):
         self.show_moving_averages()
 
     def accept(self):
-        self.ovm.auto_debris_area_margin = self.spinBox_debrisMargin.value()
-        self.acq.max_number_sweeps = self.spinBox_maxSweeps.value()
-        self.img_inspector.mean_diff_threshold = (
-            self.doubleSpinBox_diffMean.value())
-        self.img_inspector.stddev_diff_threshold = (
-            self.doubleSpinBox_diffSD.value())
-        self.img_inspector.histogram_diff_threshold = (
-            self.spinBox_diffHistogram.value())
-        self.img_inspector.image_diff_threshold = (
-            self.spinBox_diffPixels.value())
+        img_inspector = self.img_inspector
+        _store_settings(self, self.ovm, self.OV_SETTINGS)
+        _store_settings(self, self.acq, self.ACQ_SETTINGS)
+        _store_settings(self, img_inspector, self.INSPECTOR_SETTINGS)
         self.ovm.use_auto_debris_area = (
             self.radioButton_autoSelection.isChecked())
-        self.ovm.detection_area_visible = (
-            self.checkBox_showDebrisArea.isChecked())
-        self.acq.continue_after_max_sweeps = (
-            self.checkBox_continueAcq.isChecked())
         if self.radioButton_methodQuadrant.isChecked():
-            self.img_inspector.debris_detection_method = 0
+            img_inspector.debris_detection_method = 0
         elif self.radioButton_methodPixel.isChecked():
-            self.img_inspector.debris_detection_method = 1
+            img_inspector.debris_detection_method = 1
         elif self.radioButton_methodHistogram.isChecked():
-            self.img_inspector.debris_detection_method = 2
+            img_inspector.debris_detection_method = 2
         super().accept()
 
 # ------------------------------------------------------------------------------
@@ -1960,7 +2510,7 @@ class AskUserDlg(QDialog):
         super().__init__()
         loadUi('..\\gui\\ask_user_dlg.ui', self)
         self.setWindowModality(Qt.ApplicationModal)
-        self.setWindowIcon(QIcon('..\\img\\icon_16px.ico'))
+        self.setWindowIcon(_icon('..\\img\\icon_16px.ico'))
         self.setFixedSize(self.size())
         self.show()
 
@@ -1974,29 +2524,43 @@ class MirrorDriveDlg(QDialog):
         self.acq = acquisition
         loadUi('..\\gui\\mirror_drive_settings_dlg.ui', self)
         self.setWindowModality(Qt.ApplicationModal)
-        self.setWindowIcon(QIcon('..\\img\\icon_16px.ico'))
+        self.setWindowIcon(_icon('..\\img\\icon_16px.ico'))
         self.setFixedSize(self.size())
         self.show()
         self.available_drives = []
         self.label_text.setText('Please wait. Searching for drives...')
         QApplication.processEvents()
         # Search for drives in thread. If it gets stuck because drives are
-        # not accessible, user can still cancel dialog.
+        # not accessible, user can still cancel dialog. The result is shown
+        # in the GUI thread (show_available_drives()).
+        self.drive_search_trigger = utils.Trigger()
+        self.drive_search_trigger.signal.connect(self.show_available_drives)
         t = threading.Thread(target=self.search_drives)
         t.start()
 
     def search_drives(self):
-        # Search for all available drives:
+        # Search for all available drives. GetLogicalDrives() returns a
+        # bitmask of the drive letters in use (bit 0: A:, bit 1: B:, ...).
+        drive_mask = ctypes.windll.kernel32.GetLogicalDrives()
         self.available_drives = [
-            '%s:' % d for d in string.ascii_uppercase
-            if os.path.exists('%s:' % d)]
+            f'{d}:' for i, d in enumerate(string.ascii_uppercase)
+            if drive_mask & (1 << i)]
+        self.drive_search_trigger.signal.emit()
+
+    def show_available_drives(self):
         if self.available_drives:
-            self.comboBox_allDrives.addItems(self.available_drives)
-            current_index = self.comboBox_allDrives.findText(
-                self.acq.mirror_drive)
-            if current_index == -1:
+            if self.acq.mirror_drive in self.available_drives:
+                current_index = self.available_drives.index(
+                    self.acq.mirror_drive)
+            else:
                 current_index = 0
+            # Populate the selector with signals and repaints suspended
+            self.comboBox_allDrives.blockSignals(True)
+            self.comboBox_allDrives.setUpdatesEnabled(False)
+            self.comboBox_allDrives.addItems(self.available_drives)
             self.comboBox_allDrives.setCurrentIndex(current_index)
+            self.comboBox_allDrives.setUpdatesEnabled(True)
+            self.comboBox_allDrives.blockSignals(False)
             # Restore label after searching for available drives:
             self.label_text.setText('Select drive for mirroring acquired data:')
 
@@ -2023,34 +2587,42 @@ class ImageMonitoringSettingsDlg(QDialog):
     is activated. Tile-by-tile comparisons are performed for the selected tiles
     only.
     """
+
+    # Settings shown in spin boxes: (attribute, widget)
+    INSPECTOR_SETTINGS = (
+        ('mean_lower_limit', 'spinBox_meanMin'),
+        ('mean_upper_limit', 'spinBox_meanMax'),
+        ('stddev_lower_limit', 'spinBox_stddevMin'),
+        ('stddev_upper_limit', 'spinBox_stddevMax'),
+        ('tile_mean_threshold', 'doubleSpinBox_meanThreshold'),
+        ('tile_stddev_threshold', 'doubleSpinBox_stdDevThreshold'))
+
     def __init__(self, image_inspector):
         super().__init__()
         self.img_inspector = image_inspector
         loadUi('..\\gui\\image_monitoring_settings_dlg.ui', self)
         self.setWindowModality(Qt.ApplicationModal)
-        self.setWindowIcon(QIcon('..\\img\\icon_16px.ico'))
+        self.setWindowIcon(_icon('..\\img\\icon_16px.ico'))
         self.setFixedSize(self.size())
+        blocked_widgets = _block_widget_signals(self)
+        _show_settings(self, self.img_inspector, self.INSPECTOR_SETTINGS)
+        # The tile list as shown. It only has to be validated again in
+        # accept() if it has been edited.
+        self.tile_list_str = str(
+            self.img_inspector.monitoring_tile_list)[1:-1].replace('\'', '')
+        self.lineEdit_monitorTiles.setText(self.tile_list_str)
+        _unblock_widget_signals(blocked_widgets)
         self.show()
-        self.spinBox_meanMin.setValue(self.img_inspector.mean_lower_limit)
-        self.spinBox_meanMax.setValue(self.img_inspector.mean_upper_limit)
-        self.spinBox_stddevMin.setValue(self.img_inspector.stddev_lower_limit)
-        self.spinBox_stddevMax.setValue(self.img_inspector.stddev_upper_limit)
-        self.lineEdit_monitorTiles.setText(str(
-            self.img_inspector.monitoring_tile_list)[1:-1].replace('\'', ''))
-        self.doubleSpinBox_meanThreshold.setValue(
-            self.img_inspector.tile_mean_threshold)
-        self.doubleSpinBox_stdDevThreshold.setValue(
-            self.img_inspector.tile_stddev_threshold)
 
     def accept(self):
         error_str = ''
-        self.img_inspector.mean_lower_limit = self.spinBox_meanMin.value()
-        self.img_inspector.mean_upper_limit = self.spinBox_meanMax.value()
-        self.img_inspector.stddev_lower_limit = self.spinBox_stddevMin.value()
-        self.img_inspector.stddev_upper_limit = self.spinBox_stddevMax.value()
+        _store_settings(self, self.img_inspector, self.INSPECTOR_SETTINGS)
 
         tile_str = self.lineEdit_monitorTiles.text().strip()
-        if tile_str == 'all':
+        if tile_str == self.tile_list_str:
+            # Tile list unchanged
+            pass
+        elif tile_str == 'all':
             self.img_inspector.monitoring_tile_list = ['all']
         else:
             success, tile_list = utils.validate_tile_list(tile_str)
@@ -2059,10 +2631,6 @@ class ImageMonitoringSettingsDlg(QDialog):
             else:
                 error_str = 'List of selected tiles badly formatted.'
 
-        self.img_inspector.tile_mean_threshold = (
-            self.doubleSpinBox_meanThreshold.value())
-        self.img_inspector.tile_stddev_threshold = (
-            self.doubleSpinBox_stdDevThreshold.value())
         if not error_str:
             super().accept()
         else:
@@ -2079,57 +2647,62 @@ class AutofocusSettingsDlg(QDialog):
         self.autofocus = autofocus
         self.gm = grid_manager
         loadUi('..\\gui\\autofocus_settings_dlg.ui', self)
+        _disable_keyboard_tracking(self)
         self.setWindowModality(Qt.ApplicationModal)
-        self.setWindowIcon(QIcon('..\\img\\icon_16px.ico'))
+        self.setWindowIcon(_icon('..\\img\\icon_16px.ico'))
         self.setFixedSize(self.size())
-        self.show()
-        if self.autofocus.method == 0:
+        blocked_widgets = _block_widget_signals(self)
+        autofocus = self.autofocus
+        if autofocus.method == 0:
             self.radioButton_useSmartSEM.setChecked(True)
-        elif self.autofocus.method == 1:
+        elif autofocus.method == 1:
             self.radioButton_useHeuristic.setChecked(True)
-        elif self.autofocus.method == 2:
+        elif autofocus.method == 2:
             self.radioButton_useTrackingOnly.setChecked(True)
         self.radioButton_useSmartSEM.toggled.connect(self.group_box_update)
         self.radioButton_useHeuristic.toggled.connect(self.group_box_update)
         self.radioButton_useTrackingOnly.toggled.connect(self.group_box_update)
         self.group_box_update()
         # General settings
-        self.lineEdit_refTiles.setText(
-            str(self.gm.autofocus_ref_tiles)[1:-1].replace('\'', ''))
-        if self.autofocus.tracking_mode == 1:
+        # The reference tiles as shown. The list only has to be validated
+        # again in accept() if it has been edited.
+        self.ref_tiles_str = str(
+            self.gm.autofocus_ref_tiles)[1:-1].replace('\'', '')
+        self.lineEdit_refTiles.setText(self.ref_tiles_str)
+        if autofocus.tracking_mode == 1:
             self.lineEdit_refTiles.setEnabled(False)
         self.doubleSpinBox_maxWDDiff.setValue(
-            self.autofocus.max_wd_diff * 1000000)
+            autofocus.max_wd_diff * 1000000)
         self.doubleSpinBox_maxStigXDiff.setValue(
-            self.autofocus.max_stig_x_diff)
+            autofocus.max_stig_x_diff)
         self.doubleSpinBox_maxStigYDiff.setValue(
-            self.autofocus.max_stig_y_diff)
+            autofocus.max_stig_y_diff)
         self.comboBox_trackingMode.addItems(['Track selected, approx. others',
                                              'Track all active tiles',
                                              'Average over selected'])
         self.comboBox_trackingMode.setCurrentIndex(
-            self.autofocus.tracking_mode)
+            autofocus.tracking_mode)
         self.comboBox_trackingMode.currentIndexChanged.connect(
             self.change_tracking_mode)
         # SmartSEM autofocus
-        self.spinBox_interval.setValue(self.autofocus.interval)
-        self.spinBox_autostigDelay.setValue(self.autofocus.autostig_delay)
-        self.doubleSpinBox_pixelSize.setValue(self.autofocus.pixel_size)
+        self.spinBox_interval.setValue(autofocus.interval)
+        self.spinBox_autostigDelay.setValue(autofocus.autostig_delay)
+        self.doubleSpinBox_pixelSize.setValue(autofocus.pixel_size)
         # For heuristic autofocus:
         self.doubleSpinBox_wdDiff.setValue(
-            self.autofocus.wd_delta * 1000000)
+            autofocus.wd_delta * 1000000)
         self.doubleSpinBox_stigXDiff.setValue(
-            self.autofocus.stig_x_delta)
+            autofocus.stig_x_delta)
         self.doubleSpinBox_stigYDiff.setValue(
-            self.autofocus.stig_y_delta)
+            autofocus.stig_y_delta)
         self.doubleSpinBox_focusCalib.setValue(
-            self.autofocus.heuristic_calibration[0])
+            autofocus.heuristic_calibration[0])
         self.doubleSpinBox_stigXCalib.setValue(
-            self.autofocus.heuristic_calibration[1])
+            autofocus.heuristic_calibration[1])
         self.doubleSpinBox_stigYCalib.setValue(
-            self.autofocus.heuristic_calibration[2])
-        self.doubleSpinBox_stigRot.setValue(self.autofocus.rot_angle)
-        self.doubleSpinBox_stigScale.setValue(self.autofocus.scale_factor)
+            autofocus.heuristic_calibration[2])
+        self.doubleSpinBox_stigRot.setValue(autofocus.rot_angle)
+        self.doubleSpinBox_stigScale.setValue(autofocus.scale_factor)
         # Disable some settings if MagC mode is active
         if magc_mode:
             self.radioButton_useHeuristic.setEnabled(False)
@@ -2138,6 +2711,8 @@ class AutofocusSettingsDlg(QDialog):
             self.spinBox_interval.setEnabled(False)
             # make autostig interval work on grids instead of slices
             self.label_fdp_4.setText('Autostig interval (grids) ')
+        _unblock_widget_signals(blocked_widgets)
+        self.show()
 
     def group_box_update(self):
         if self.radioButton_useSmartSEM.isChecked():
@@ -2154,9 +2729,8 @@ class AutofocusSettingsDlg(QDialog):
             diffs_enabled = False
         self.groupBox_ZEISS_af.setEnabled(zeiss_enabled)
         self.groupBox_heuristic_af.setEnabled(heuristic_enabled)
-        self.doubleSpinBox_maxWDDiff.setEnabled(diffs_enabled)
-        self.doubleSpinBox_maxStigXDiff.setEnabled(diffs_enabled)
-        self.doubleSpinBox_maxStigYDiff.setEnabled(diffs_enabled)
+        # Container for the max. WD and stig X/Y diff spin boxes
+        self.widget_maxDiffs.setEnabled(diffs_enabled)
 
     def change_tracking_mode(self):
         """Let user confirm switch to "track all"."""
@@ -2169,7 +2743,7 @@ class AutofocusSettingsDlg(QDialog):
                 QMessageBox.Ok, QMessageBox.Cancel)
             if response == QMessageBox.Ok:
                 self.lineEdit_refTiles.setText(
-                    str(self.gm.active_tile_key_list())[1:-1].replace('\'', ''))
+                    ', '.join(self.gm.active_tile_key_list()))
                 self.lineEdit_refTiles.setEnabled(False)
             else:
                 # Revert to tracking mode 0:
@@ -2181,39 +2755,41 @@ class AutofocusSettingsDlg(QDialog):
 
     def accept(self):
         error_str = ''
+        autofocus = self.autofocus
         if self.radioButton_useSmartSEM.isChecked():
-            self.autofocus.method = 0
+            autofocus.method = 0
         elif self.radioButton_useHeuristic.isChecked():
-            self.autofocus.method = 1
+            autofocus.method = 1
         elif self.radioButton_useTrackingOnly.isChecked():
-            self.autofocus.method = 2
+            autofocus.method = 2
 
-        success, tile_list = utils.validate_tile_list(
-            self.lineEdit_refTiles.text())
-        if success:
-            self.gm.autofocus_ref_tiles = tile_list
-        else:
-            error_str = 'List of selected tiles badly formatted.'
-        self.autofocus.tracking_mode = (
+        ref_tiles_str = self.lineEdit_refTiles.text()
+        if ref_tiles_str != self.ref_tiles_str:
+            success, tile_list = utils.validate_tile_list(ref_tiles_str)
+            if success:
+                self.gm.autofocus_ref_tiles = tile_list
+            else:
+                error_str = 'List of selected tiles badly formatted.'
+        autofocus.tracking_mode = (
             self.comboBox_trackingMode.currentIndex())
-        self.autofocus.max_wd_diff = (
+        autofocus.max_wd_diff = (
             self.doubleSpinBox_maxWDDiff.value() / 1000000)
-        self.autofocus.max_stig_x_diff = (
+        autofocus.max_stig_x_diff = (
             self.doubleSpinBox_maxStigXDiff.value())
-        self.autofocus.max_stig_y_diff = (
+        autofocus.max_stig_y_diff = (
             self.doubleSpinBox_maxStigYDiff.value())
-        self.autofocus.interval = self.spinBox_interval.value()
-        self.autofocus.autostig_delay = self.spinBox_autostigDelay.value()
-        self.autofocus.pixel_size = self.doubleSpinBox_pixelSize.value()
-        self.autofocus.wd_delta = self.doubleSpinBox_wdDiff.value() / 1000000
-        self.autofocus.stig_x_delta = self.doubleSpinBox_stigXDiff.value()
-        self.autofocus.stig_y_delta = self.doubleSpinBox_stigYDiff.value()
-        self.autofocus.heuristic_calibration = [
+        autofocus.interval = self.spinBox_interval.value()
+        autofocus.autostig_delay = self.spinBox_autostigDelay.value()
+        autofocus.pixel_size = self.doubleSpinBox_pixelSize.value()
+        autofocus.wd_delta = self.doubleSpinBox_wdDiff.value() / 1000000
+        autofocus.stig_x_delta = self.doubleSpinBox_stigXDiff.value()
+        autofocus.stig_y_delta = self.doubleSpinBox_stigYDiff.value()
+        autofocus.heuristic_calibration = [
             self.doubleSpinBox_focusCalib.value(),
             self.doubleSpinBox_stigXCalib.value(),
             self.doubleSpinBox_stigYCalib.value()]
-        self.autofocus.rot_angle = self.doubleSpinBox_stigRot.value()
-        self.autofocus.scale_factor = self.doubleSpinBox_stigScale.value()
+        autofocus.rot_angle = self.doubleSpinBox_stigRot.value()
+        autofocus.scale_factor = self.doubleSpinBox_stigScale.value()
         if not error_str:
             super().accept()
         else:
@@ -2229,7 +2805,7 @@ class PlasmaCleanerDlg(QDialog):
         self.plc = plc
         loadUi('..\\gui\\plasma_cleaner_dlg.ui', self)
         self.setWindowModality(Qt.ApplicationModal)
-        self.setWindowIcon(QIcon('icon.ico'))
+        self.setWindowIcon(_icon('..\\img\\icon_16px.ico'))
         self.setFixedSize(self.size())
         self.show()
         try:
@@ -2247,11 +2823,12 @@ class PlasmaCleanerDlg(QDialog):
 
     def set_target_parameters(self):
         try:
+            # Send both settings first, then read them back after a single
+            # pause (instead of pausing after each setting)
             self.plc.set_power(self.spinBox_targetPower.value())
-            sleep(0.5)
-            self.lineEdit_currentPower.setText(str(self.plc.get_power()))
             self.plc.set_duration(self.spinBox_targetDuration.value())
             sleep(0.5)
+            self.lineEdit_currentPower.setText(str(self.plc.get_power()))
             self.lineEdit_currentDuration.setText(str(self.plc.get_duration()))
         except:
             QMessageBox.warning(
@@ -2298,8 +2875,9 @@ class ApproachDlg(QDialog):
         self.microtome = microtome
         self.main_controls_trigger = main_controls_trigger
         loadUi('..\\gui\\approach_dlg.ui', self)
+        _disable_keyboard_tracking(self)
         self.setWindowModality(Qt.ApplicationModal)
-        self.setWindowIcon(QIcon('..\\img\\icon_16px.ico'))
+        self.setWindowIcon(_icon('..\\img\\icon_16px.ico'))
         self.setFixedSize(self.size())
         self.show()
         # Set up trigger and queue to update dialog GUI during approach
@@ -2320,24 +2898,34 @@ class ApproachDlg(QDialog):
         self.aborted = False
         self.z_mismatch = False
         self.max_slices = self.spinBox_numberSlices.value()
+        # (slice_counter, max_slices) currently shown
+        self.shown_progress = None
         self.update_progress()
 
-    def add_to_log(self, msg):
-        self.main_controls_trigger.transmit(utils.format_log_entry(msg))
+    def add_to_log(self, *msgs):
+        """Send one or more log entries to Main Controls in one transmission
+        (the entries are shown on separate lines).
+        """
+        self.main_controls_trigger.transmit(
+            '\n'.join([utils.format_log_entry(msg) for msg in msgs]))
 
     def update_progress(self):
         self.max_slices = self.spinBox_numberSlices.value()
+        progress = (self.slice_counter, self.max_slices)
+        if progress == self.shown_progress:
+            return
+        self.shown_progress = progress
         if self.slice_counter > 0:
             remaining_time_str = (
-                '    ' + str(int((self.max_slices - self.slice_counter) * 12))
-                + ' seconds left')
+                f'    {(self.max_slices - self.slice_counter) * 12} '
+                f'seconds left')
         else:
             remaining_time_str = ''
-        self.label_statusApproach.setText(str(self.slice_counter) + '/'
-                                          + str(self.max_slices)
-                                          + remaining_time_str)
-        self.progressBar_approach.setValue(
-            int(self.slice_counter/self.max_slices * 100))
+        self.label_statusApproach.setText(
+            f'{self.slice_counter}/{self.max_slices}{remaining_time_str}')
+        percentage = int(self.slice_counter/self.max_slices * 100)
+        if percentage != self.progressBar_approach.value():
+            self.progressBar_approach.setValue(percentage)
 
     def start_approach(self):
         self.pushButton_startApproach.setEnabled(False)
@@ -2365,9 +2953,9 @@ class ApproachDlg(QDialog):
         if not self.aborted:
             QMessageBox.information(
                 self, 'Approach finished',
-                str(self.max_slices) + ' slices have been cut successfully. '
-                'Total sample depth removed: '
-                + str(self.max_slices * self.thickness / 1000) + ' µm.',
+                f'{self.max_slices} slices have been cut successfully. '
+                f'Total sample depth removed: '
+                f'{self.max_slices * self.thickness / 1000} µm.',
                 QMessageBox.Ok)
             self.slice_counter = 0
             self.update_progress()
@@ -2383,9 +2971,9 @@ class ApproachDlg(QDialog):
         else:
             QMessageBox.warning(
                 self, 'Approach aborted',
-                str(self.slice_counter) + ' slices have been cut. '
-                'Total sample depth removed: '
-                + str(self.slice_counter * self.thickness / 1000) + ' µm.',
+                f'{self.slice_counter} slices have been cut. '
+                f'Total sample depth removed: '
+                f'{self.slice_counter * self.thickness / 1000} µm.',
                 QMessageBox.Ok)
             self.slice_counter = 0
             self.update_progress()
@@ -2403,7 +2991,8 @@ class ApproachDlg(QDialog):
         self.slice_counter = 0
         self.max_slices = self.spinBox_numberSlices.value()
         self.thickness = self.spinBox_thickness.value()
-        self.progress_trigger.signal.emit()
+        # The dialog already shows the progress for slice_counter == 0. The
+        # progress is then updated once per slice (queued, non-blocking).
         # Get current z position of stage
         z_position = self.microtome.get_stage_z(wait_interval=1)
         if z_position is None or z_position < 0:
@@ -2420,22 +3009,30 @@ class ApproachDlg(QDialog):
             self.aborted = True
             self.add_to_log(
                 'STAGE: Z position mismatch. Approach aborted.')
-        self.main_controls_trigger.transmit('UPDATE Z')
         if not self.aborted:
             self.microtome.near_knife()
-            self.add_to_log('KNIFE: Moving to "Near" position.')
             if self.microtome.error_state > 0:
-                self.add_to_log(
-                    'KNIFE: Error moving to "Near" position. '
-                    'Approach aborted.')
+                self.add_to_log('KNIFE: Moving to "Near" position.',
+                                'KNIFE: Error moving to "Near" position. '
+                                'Approach aborted.')
                 self.aborted = True
                 self.microtome.reset_error_state()
+            else:
+                self.add_to_log('KNIFE: Moving to "Near" position.')
+        if self.aborted:
+            # Otherwise, Z is shown after the first move in the loop below
+            self.main_controls_trigger.transmit('UPDATE Z')
+        # Log entries that are sent to Main Controls together with the next
+        # entry
+        pending_log = []
         # ====== Approach loop =========
         while (self.slice_counter < self.max_slices) and not self.aborted:
             # Move to new z position
             z_position = z_position + (self.thickness / 1000)
             self.add_to_log(
-                'STAGE: Move to new Z: ' + '{0:.3f}'.format(z_position))
+                *pending_log,
+                f'STAGE: Move to new Z: {z_position:.3f}')
+            pending_log = []
             self.microtome.move_stage_to_z(z_position)
             # Show new Z position in main window
             self.main_controls_trigger.transmit('UPDATE Z')
@@ -2446,8 +3043,8 @@ class ApproachDlg(QDialog):
                 self.aborted = True
                 self.microtome.reset_error_state()
                 break
-            self.add_to_log('KNIFE: Cutting in progress ('
-                            + str(self.thickness) + ' nm cutting thickness).')
+            self.add_to_log(f'KNIFE: Cutting in progress '
+                            f'({self.thickness} nm cutting thickness).')
             # Do the approach cut (cut, retract, in near position)
             self.microtome.do_full_approach_cut()
             sleep(self.microtome.full_cut_duration - 5)
@@ -2458,11 +3055,13 @@ class ApproachDlg(QDialog):
                 self.microtome.reset_error_state()
                 break
             else:
-                self.add_to_log('KNIFE: Approach cut completed.')
+                pending_log.append('KNIFE: Approach cut completed.')
                 self.slice_counter += 1
                 # Update progress bar and slice counter
                 self.progress_trigger.signal.emit()
         # ====== End of approach loop =========
+        if pending_log:
+            self.add_to_log(*pending_log)
         # Signal that thread is done:
         self.finish_trigger.signal.emit()
 
@@ -2494,21 +3093,17 @@ class GrabFrameDlg(QDialog):
         self.finish_trigger.signal.connect(self.scan_complete)
         loadUi('..\\gui\\grab_frame_dlg.ui', self)
         self.setWindowModality(Qt.ApplicationModal)
-        self.setWindowIcon(QIcon('..\\img\\icon_16px.ico'))
+        self.setWindowIcon(_icon('..\\img\\icon_16px.ico'))
         self.setFixedSize(self.size())
         self.show()
-        timestamp = str(datetime.datetime.now())
-        # Remove some characters from timestap to get valid file name
-        timestamp = timestamp[:19].translate({ord(c): None for c in ' :-.'})
-        self.file_name = 'image_' + timestamp
+        self.file_name = (
+            'image_' + datetime.datetime.now().strftime('%Y%m%d%H%M%S'))
         self.lineEdit_filename.setText(self.file_name)
-        store_res_list = [
-            '%d × %d' % (res[0], res[1]) for res in self.sem.STORE_RES]
-        self.comboBox_frameSize.addItems(store_res_list)
+        self.comboBox_frameSize.addItems(self.sem.STORE_RES_STRS)
         self.comboBox_frameSize.setCurrentIndex(
             self.sem.grab_frame_size_selector)
         self.doubleSpinBox_pixelSize.setValue(self.sem.grab_pixel_size)
-        self.comboBox_dwellTime.addItems(map(str, self.sem.DWELL_TIME))
+        self.comboBox_dwellTime.addItems(self.sem.DWELL_TIME_STRS)
         self.comboBox_dwellTime.setCurrentIndex(
             self.sem.DWELL_TIME.index(self.sem.grab_dwell_time))
         self.pushButton_scan.clicked.connect(self.scan_frame)
@@ -2595,27 +3190,38 @@ class EHTDlg(QDialog):
     def __init__(self, sem):
         super().__init__()
         self.sem = sem
+        # Timer for polling the EHT state after switching it on or off
+        self.eht_poll_timer = QTimer(self)
+        self.eht_poll_timer.setSingleShot(True)
+        self.eht_poll_timer.timeout.connect(self.poll_eht)
         loadUi('..\\gui\\eht_dlg.ui', self)
         self.setWindowModality(Qt.ApplicationModal)
-        self.setWindowIcon(QIcon('..\\img\\icon_16px.ico'))
+        self.setWindowIcon(_icon('..\\img\\icon_16px.ico'))
         self.setFixedSize(self.size())
         self.show()
         self.pushButton_on.clicked.connect(self.turn_on)
         self.pushButton_off.clicked.connect(self.turn_off)
+        # Palettes for the status label (red text if EHT on, black if off)
+        self.palette_on = QPalette(self.label_EHTStatus.palette())
+        self.palette_on.setColor(QPalette.WindowText, QColor(Qt.red))
+        self.palette_off = QPalette(self.label_EHTStatus.palette())
+        self.palette_off.setColor(QPalette.WindowText, QColor(Qt.black))
+        # EHT state currently shown in the dialog (None: must be updated)
+        self.eht_on_shown = None
         self.update_status()
 
     def update_status(self):
-        if self.sem.is_eht_on():
-            pal = QPalette(self.label_EHTStatus.palette())
-            pal.setColor(QPalette.WindowText, QColor(Qt.red))
-            self.label_EHTStatus.setPalette(pal)
+        eht_on = self.sem.is_eht_on()
+        if eht_on == self.eht_on_shown:
+            return
+        self.eht_on_shown = eht_on
+        if eht_on:
+            self.label_EHTStatus.setPalette(self.palette_on)
             self.label_EHTStatus.setText('ON')
             self.pushButton_on.setEnabled(False)
             self.pushButton_off.setEnabled(True)
         else:
-            pal = QPalette(self.label_EHTStatus.palette())
-            pal.setColor(QPalette.WindowText, QColor(Qt.black))
-            self.label_EHTStatus.setPalette(pal)
+            self.label_EHTStatus.setPalette(self.palette_off)
             self.label_EHTStatus.setText('OFF')
             self.pushButton_on.setEnabled(True)
             self.pushButton_off.setEnabled(False)
@@ -2623,33 +3229,42 @@ class EHTDlg(QDialog):
     def turn_on(self):
         self.pushButton_on.setEnabled(False)
         self.pushButton_on.setText('Wait')
-        thread = threading.Thread(target=self.send_on_cmd_and_wait)
-        thread.start()
+        self.eht_on_shown = None
+        QApplication.processEvents()
+        self.sem.turn_eht_on()
+        self.wait_for_eht(self.sem.is_eht_on, self.pushButton_on, 'ON')
 
     def turn_off(self):
         self.pushButton_off.setEnabled(False)
         self.pushButton_off.setText('Wait')
+        self.eht_on_shown = None
         QApplication.processEvents()
-        thread = threading.Thread(target=self.send_off_cmd_and_wait)
-        thread.start()
-
-    def send_on_cmd_and_wait(self):
-        self.sem.turn_eht_on()
-        max_wait_time = 15
-        while not self.sem.is_eht_on() and max_wait_time > 0:
-            sleep(1)
-            max_wait_time -= 1
-        self.pushButton_on.setText('ON')
-        self.update_status()
-
-    def send_off_cmd_and_wait(self):
         self.sem.turn_eht_off()
-        max_wait_time = 15
-        while not self.sem.is_eht_off() and max_wait_time > 0:
-            sleep(1)
-            max_wait_time -= 1
-        self.pushButton_off.setText('OFF')
-        self.update_status()
+        self.wait_for_eht(self.sem.is_eht_off, self.pushButton_off, 'OFF')
+
+    def wait_for_eht(self, eht_state_reached, button, button_text,
+                     max_wait_time=15):
+        """Poll eht_state_reached() with a single-shot timer (in the GUI
+        thread) until it returns True or max_wait_time (in seconds) has
+        elapsed, then restore button_text and update the status. The polling
+        interval starts at 0.1 s and is increased up to 1 s, so that a fast
+        transition is detected quickly without querying the SEM too often
+        during a slow one.
+        """
+        self.eht_state_reached = eht_state_reached
+        self.eht_button = button
+        self.eht_button_text = button_text
+        self.eht_deadline = monotonic() + max_wait_time
+        self.eht_poll_delay = 0.1
+        self.poll_eht()
+
+    def poll_eht(self):
+        if self.eht_state_reached() or monotonic() >= self.eht_deadline:
+            self.eht_button.setText(self.eht_button_text)
+            self.update_status()
+        else:
+            self.eht_poll_timer.start(int(self.eht_poll_delay * 1000))
+            self.eht_poll_delay = min(self.eht_poll_delay * 1.5, 1)
 
 # ------------------------------------------------------------------------------
 
@@ -2665,7 +3280,7 @@ class FTSetParamsDlg(QDialog):
         self.sem = sem
         loadUi('..\\gui\\focus_tool_set_params_dlg.ui', self)
         self.setWindowModality(Qt.ApplicationModal)
-        self.setWindowIcon(QIcon('..\\img\\icon_16px.ico'))
+        self.setWindowIcon(_icon('..\\img\\icon_16px.ico'))
         self.setFixedSize(self.size())
         self.show()
         if simulation_mode:
@@ -2701,11 +3316,12 @@ class FTMoveDlg(QDialog):
     """Move the stage to the selected tile or OV position."""
 
     def __init__(self, microtome, coordinate_system, grid_manager,
-                 grid_index, tile_index, ov_index):
+                 overview_manager, grid_index, tile_index, ov_index):
         super().__init__()
         self.microtome = microtome
         self.cs = coordinate_system
         self.gm = grid_manager
+        self.ovm = overview_manager
         self.ov_index = ov_index
         self.grid_index = grid_index
         self.tile_index = tile_index
@@ -2714,7 +3330,7 @@ class FTMoveDlg(QDialog):
         self.finish_trigger.signal.connect(self.move_completed)
         loadUi('..\\gui\\focus_tool_move_dlg.ui', self)
         self.setWindowModality(Qt.ApplicationModal)
-        self.setWindowIcon(QIcon('..\\img\\icon_16px.ico'))
+        self.setWindowIcon(_icon('..\\img\\icon_16px.ico'))
         self.setFixedSize(self.size())
         self.show()
         self.pushButton_move.clicked.connect(self.start_move)
@@ -2732,18 +3348,23 @@ class FTMoveDlg(QDialog):
         thread.start()
 
     def move_and_wait(self):
-        # Load target coordinates
-        if self.ov_index >= 0:
-            stage_x, stage_y = self.ovm[self.ov_index].centre_sx_sy
-        elif self.tile_index >= 0:
-            stage_x, stage_y = self.gm[self.grid_index][self.tile_index].sx_sy
-        # Now move the stage
-        self.microtome.move_stage_to_xy((stage_x, stage_y))
-        if self.microtome.error_state > 0:
+        try:
+            # Load target coordinates
+            if self.ov_index >= 0:
+                stage_x, stage_y = self.ovm[self.ov_index].centre_sx_sy
+            elif self.tile_index >= 0:
+                stage_x, stage_y = (
+                    self.gm[self.grid_index][self.tile_index].sx_sy)
+            # Now move the stage
+            self.microtome.move_stage_to_xy((stage_x, stage_y))
+            if self.microtome.error_state > 0:
+                self.error = True
+                self.microtome.reset_error_state()
+        except Exception:
             self.error = True
-            self.microtome.reset_error_state()
-        # Signal that move complete
-        self.finish_trigger.signal.emit()
+        finally:
+            # Signal that move complete (the button is enabled again)
+            self.finish_trigger.signal.emit()
 
     def move_completed(self):
         if self.error:
@@ -2772,9 +3393,10 @@ class MotorTestDlg(QDialog):
         self.microtome = microtome
         self.acq = acq
         self.main_controls_trigger = main_controls_trigger
+        self.log_path = os.path.join(self.acq.base_dir, 'motor_test_log.txt')
         loadUi('..\\gui\\motor_test_dlg.ui', self)
         self.setWindowModality(Qt.ApplicationModal)
-        self.setWindowIcon(QIcon('..\\img\\icon_16px.ico'))
+        self.setWindowIcon(_icon('..\\img\\icon_16px.ico'))
         self.setFixedSize(self.size())
         self.show()
         # Set up trigger and queue to update dialog GUI during approach
@@ -2790,23 +3412,26 @@ class MotorTestDlg(QDialog):
         self.pushButton_startTest.setEnabled(True)
         self.pushButton_abortTest.setEnabled(False)
         self.test_in_progress = False
-        self.start_time = None
+        # Set to stop the test thread
+        self.stop_requested = threading.Event()
+        # Progress of the current test in percent
+        self.progress = 0
+        # True while a progress update has been sent to the GUI thread, but
+        # not yet been shown
+        self.progress_update_pending = False
 
     def add_to_log(self, msg):
         self.main_controls_trigger.transmit(utils.format_log_entry(msg))
 
     def update_progress(self):
-        if self.start_time is not None:
-            elapsed_time = time() - self.start_time
-            if elapsed_time > self.duration * 60:
-                self.test_in_progress = False
-                self.progressBar.setValue(100)
-            else:
-                self.progressBar.setValue(
-                    int(elapsed_time/(self.duration * 60) * 100))
+        # Clear the flag before reading self.progress, so that a newer value
+        # is sent again
+        self.progress_update_pending = False
+        self.progressBar.setValue(min(self.progress, 100))
 
     def start_random_walk(self):
         self.aborted = False
+        self.stop_requested.clear()
         self.start_z = self.microtome.get_stage_z()
         if self.start_z is not None:
             self.pushButton_startTest.setEnabled(False)
@@ -2824,7 +3449,7 @@ class MotorTestDlg(QDialog):
 
     def abort_random_walk(self):
         self.aborted = True
-        self.test_in_progress = False
+        self.stop_requested.set()
 
     def test_finished(self):
         self.add_to_log('CTRL: Motor test finished.')
@@ -2861,64 +3486,132 @@ class MotorTestDlg(QDialog):
         self.test_in_progress = False
 
     def random_walk_thread(self):
+        import numpy as np
         self.test_in_progress = True
-        self.duration = self.spinBox_duration.value()
-        self.start_time = time()
+        duration = self.spinBox_duration.value() * 60  # in seconds
+        start_time = monotonic()
+        self.progress = 0
+        self.progress_update_pending = True
         self.progress_trigger.signal.emit()
         self.number_tests = 0
         self.number_errors = 0
         current_x, current_y = 0, 0
         current_z = self.start_z
-        # Open log file
-        logfile = open(os.path.join(self.acq.base_dir, 'motor_test_log.txt'),
-                       'w', buffering=1)
-        while self.test_in_progress:
-            # Start 'random' walk
-            if self.number_tests % 10 == 0:
-                dist = 300  # longer move every 10th cycle
-            else:
-                dist = 50
-            current_x += (random() - 0.5) * dist
-            current_y += (random() - 0.5) * dist
-            if self.number_tests % 2 == 0:
-                current_z += (random() - 0.5) * 0.2
-            else:
-                current_z += 0.025
-            if current_z < 0:
-                current_z = 0
-            # If end of permissable range is reached, go back to starting point
-            if (abs(current_x) > 600 or
-                abs(current_y) > 600 or
-                current_z > 600):
-                current_x, current_y = 0, 0
-                current_z = self.start_z
-            logfile.write('{0:.3f}, '.format(current_x)
-                          + '{0:.3f}, '.format(current_y)
-                          + '{0:.3f}'.format(current_z) + '\n')
-            self.microtome.move_stage_to_xy((current_x, current_y))
-            if self.microtome.error_state > 0:
-                self.number_errors += 1
-                logfile.write('ERROR DURING XY MOVE: '
-                              + self.microtome.error_info
-                              + '\n')
-                self.microtome.reset_error_state()
-            else:
-                self.microtome.move_stage_to_z(current_z, safe_mode=False)
-                if self.microtome.error_state > 0:
+        # Open log file with a large buffer instead of line buffering. The
+        # file is written from start to end: tell the OS (_O_SEQUENTIAL).
+        # Newlines are translated by Python, not by the C runtime (_O_BINARY).
+        # The log is written by a separate thread, so that the moves are not
+        # delayed by disk writes.
+        fd = os.open(self.log_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+                     | _O_BINARY | _O_SEQUENTIAL)
+        logfile = open(fd, 'w', buffering=1 << 17)
+        chunk_queue = Queue()
+        writer_thread = threading.Thread(target=self.write_log_chunks,
+                                         args=(logfile, chunk_queue),
+                                         daemon=True)
+        writer_thread.start()
+        # Log entries are collected in log_entries and passed to the writer
+        # thread in chunks
+        log_entries = []
+        try:
+            # Local references to the objects and methods used in every
+            # iteration
+            microtome = self.microtome
+            move_stage_to_xy = microtome.move_stage_to_xy
+            move_stage_to_z = microtome.move_stage_to_z
+            reset_error_state = microtome.reset_error_state
+            add_log_entry = log_entries.append
+            emit_progress = self.progress_trigger.signal.emit
+            is_stop_requested = self.stop_requested.is_set
+            # The random offsets for the walk are generated in blocks. The
+            # seed is written to the log, so that a test can be repeated with
+            # the same sequence of moves.
+            seed_sequence = np.random.SeedSequence()
+            rng = np.random.default_rng(seed_sequence)
+            add_log_entry(f'RANDOM SEED: {seed_sequence.entropy}\n')
+            block_size = 1024
+            while not is_stop_requested():
+                # Start 'random' walk
+                block_index = self.number_tests % block_size
+                if block_index == 0:
+                    # Offsets between -0.5 and 0.5 (X, Y, Z) for the next moves
+                    offsets = (rng.random((block_size, 3)) - 0.5).tolist()
+                offset_x, offset_y, offset_z = offsets[block_index]
+                if self.number_tests % 10 == 0:
+                    dist = 300  # longer move every 10th cycle
+                else:
+                    dist = 50
+                current_x += offset_x * dist
+                current_y += offset_y * dist
+                if self.number_tests % 2 == 0:
+                    current_z += offset_z * 0.2
+                else:
+                    current_z += 0.025
+                if current_z < 0:
+                    current_z = 0
+                # If end of permissable range is reached, go back to starting
+                # point
+                if (abs(current_x) > 600 or
+                    abs(current_y) > 600 or
+                    current_z > 600):
+                    current_x, current_y = 0, 0
+                    current_z = self.start_z
+                add_log_entry(
+                    f'{current_x:.3f}, {current_y:.3f}, {current_z:.3f}\n')
+                move_stage_to_xy((current_x, current_y))
+                if microtome.error_state > 0:
                     self.number_errors += 1
-                    logfile.write('ERROR DURING Z MOVE: '
-                                  + self.microtome.error_info
-                                  + '\n')
-                    self.microtome.reset_error_state()
+                    add_log_entry(
+                        f'ERROR DURING XY MOVE: {microtome.error_info}\n')
+                    reset_error_state()
                 else:
-                    logfile.write('OK\n')
-
-            self.number_tests += 1
-            self.progress_trigger.signal.emit()
-        logfile.write('NUMBER OF ERRORS: ' + str(self.number_errors))
+                    move_stage_to_z(current_z, safe_mode=False)
+                    if microtome.error_state > 0:
+                        self.number_errors += 1
+                        add_log_entry(
+                            f'ERROR DURING Z MOVE: {microtome.error_info}\n')
+                        reset_error_state()
+                    else:
+                        add_log_entry('OK\n')
+
+                self.number_tests += 1
+                if len(log_entries) >= 64:
+                    chunk_queue.put(''.join(log_entries))
+                    log_entries.clear()
+                progress = int((monotonic() - start_time) / duration * 100)
+                # The progress bar is only updated when the percentage changes,
+                # and only if the previous update has been shown (otherwise,
+                # update_progress() will show the new value)
+                if progress != self.progress:
+                    self.progress = progress
+                    if not self.progress_update_pending:
+                        self.progress_update_pending = True
+                        emit_progress()
+                if progress >= 100:
+                    # Test duration reached
+                    break
+        finally:
+            # Also if the test has been aborted or an error has occurred:
+            # pass the remaining entries to the writer thread, and wait
+            # until it has written them and closed the log file
+            log_entries.append(f'NUMBER OF ERRORS: {self.number_errors}')
+            chunk_queue.put(''.join(log_entries))
+            chunk_queue.put(None)
+            writer_thread.join()
+            # Signal that thread is done
+            self.finish_trigger.signal.emit()
+
+    def write_log_chunks(self, logfile, chunk_queue):
+        """Write the chunks of log entries received through chunk_queue to
+        logfile until None is received, then close logfile. The file is
+        flushed whenever no further chunk is waiting, so that the log of a
+        long test can be inspected while the test is running.
+        """
+        for chunk in iter(chunk_queue.get, None):
+            logfile.write(chunk)
+            if chunk_queue.empty():
+                logfile.flush()
         logfile.close()
-        # Signal that thread is done
-        self.finish_trigger.signal.emit()
 
     def abort_test(self):
         self.aborted = True
@@ -2944,7 +3637,7 @@ class SendCommandDlg(QDialog):
         self.microtome = microtome
         loadUi('..\\gui\\send_dm_command_dlg.ui', self)
         self.setWindowModality(Qt.ApplicationModal)
-        self.setWindowIcon(QIcon('..\\img\\icon_16px.ico'))
+        self.setWindowIcon(_icon('..\\img\\icon_16px.ico'))
         self.setFixedSize(self.size())
         self.show()
         self.pushButton_sendCommand.clicked.connect(self.send_command)
@@ -3034,6 +3727,14 @@ class SendCommandDlg(QDialog):
 
 # ------------------------------------------------------------------------------
 
+@lru_cache(maxsize=None)
+def _ui_form_class(path):
+    """Return the form class compiled from the .ui file at path. The file is
+    parsed when the form is first needed (not when this module is imported),
+    and only once.
+    """
+    return loadUiType(path)[0]
+
 class AboutBox(QDialog):
     """Show the About dialog box with info about SBEMimage and the current
     version and release date.
@@ -3041,13 +3742,14 @@ class AboutBox(QDialog):
 
     def __init__(self, VERSION):
         super().__init__()
-        loadUi('..\\gui\\about_box.ui', self)
+        self.ui = _ui_form_class('..\\gui\\about_box.ui')()
+        self.ui.setupUi(self)
         self.setWindowModality(Qt.ApplicationModal)
-        self.setWindowIcon(QIcon('..\\img\\icon_16px.ico'))
+        self.setWindowIcon(_icon('..\\img\\icon_16px.ico'))
         if VERSION.lower() == 'dev':
-            self.label_version.setText('DEVELOPMENT VERSION')
+            self.ui.label_version.setText('DEVELOPMENT VERSION')
         else:
-            self.label_version.setText('Version ' + VERSION)
-        self.labelIcon.setPixmap(QPixmap('..\\img\\logo.png'))
+            self.ui.label_version.setText('Version ' + VERSION)
+        self.ui.labelIcon.setPixmap(_pixmap('..\\img\\logo.png'))
         self.setFixedSize(self.size())
         self.show()
@@ -96,8 +96,13 @@ class SEM:
         """Load all SEM-related constants from system configuration."""
         # self.STORE_RES: available store resolutions (= frame size in pixels)
         self.STORE_RES = json.loads(self.syscfg['sem']['store_res'])
+        # Store resolutions as strings, created on first use
+        # (see STORE_RES_STRS)
+        self._store_res_strs = None
         # self.DWELL_TIME: available dwell times in microseconds
         self.DWELL_TIME = json.loads(self.syscfg['sem']['dwell_time'])
+        # Dwell times as strings, created on first use (see DWELL_TIME_STRS)
+        self._dwell_time_strs = None
         # Cycle times: Duration of scanning one full frame, depends on
         # scan rate and frame size:
         # cycle_time[frame_size_selector][scan_rate] -> duration in sec
@@ -112,6 +117,22 @@ class SEM:
         # M = MAG_PX_SIZE_FACTOR / (STORE_RES_X * PX_SIZE)
         self.MAG_PX_SIZE_FACTOR = int(self.syscfg['sem']['mag_px_size_factor'])
 
+    @property
+    def STORE_RES_STRS(self):
+        """Available store resolutions as strings ('width × height'), for
+        populating comboboxes."""
+        if self._store_res_strs is None:
+            self._store_res_strs = [
+                '%d × %d' % (res[0], res[1]) for res in self.STORE_RES]
+        return self._store_res_strs
+
+    @property
+    def DWELL_TIME_STRS(self):
+        """Available dwell times as strings, for populating comboboxes."""
+        if self._dwell_time_strs is None:
+            self._dwell_time_strs = [str(t) for t in self.DWELL_TIME]
+        return self._dwell_time_strs
+
     def save_to_cfg(self):
         """Save current values of attributes to config and sysconfig objects."""
         self.syscfg['sem']['mag_px_size_factor'] = str(self.MAG_PX_SIZE_FACTOR)
@@ -261,6 +282,19 @@ class SEM:
         """Set Y stigmation parameter (in %)."""
         raise NotImplementedError
 
+    def get_beam_snapshot(self):
+        """Read the current EHT (kV), beam current (pA), working distance (m)
+        and XY stigmation (%) from the SEM. This bundles the individual
+        (sequential) reads into a single method, so that they can be done
+        together in a thread. Return the values as a dict with the keys 'eht',
+        'beam_current', 'wd', 'stig_x', 'stig_y'."""
+        stig_x, stig_y = self.get_stig_xy()
+        return {'eht': self.get_eht(),
+                'beam_current': self.get_beam_current(),
+                'wd': self.get_wd(),
+                'stig_x': stig_x,
+                'stig_y': stig_y}
+
     def set_beam_blanking(self, enable_blanking):
         """Enable beam blanking if enable_blanking == True."""
         raise NotImplementedError
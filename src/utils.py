@@ -51,9 +51,10 @@ TILE_DIGITS = 4       # up to 9999 tiles per grid
 SLICE_DIGITS = 5      # up to 99999 slices per stack
 
 # Regular expressions for checking user input of tiles and overviews
-RE_TILE_LIST = re.compile('^((0|[1-9][0-9]*)[.](0|[1-9][0-9]*))'
-                          '([ ]*,[ ]*(0|[1-9][0-9]*)[.](0|[1-9][0-9]*))*$')
-RE_OV_LIST = re.compile('^([0-9]+)([ ]*,[ ]*[0-9]+)*$')
+# (used with fullmatch())
+RE_TILE_LIST = re.compile('((0|[1-9][0-9]*)[.](0|[1-9][0-9]*))'
+                          '([ ]*,[ ]*(0|[1-9][0-9]*)[.](0|[1-9][0-9]*))*')
+RE_OV_LIST = re.compile('([0-9]+)([ ]*,[ ]*[0-9]+)*')
 
 ERROR_LIST = {
     0: 'No error',
@@ -255,7 +256,7 @@ def validate_tile_list(input_str):
     if not input_str:
         tile_list = []
     else:
-        if RE_TILE_LIST.match(input_str):
+        if RE_TILE_LIST.fullmatch(input_str):
             tile_list = [s.strip() for s in input_str.split(',')]
         else:
             tile_list = []
@@ -268,7 +269,7 @@ def validate_ov_list(input_str):
     if not input_str:
         ov_list = []
     else:
-        if RE_OV_LIST.match(input_str):
+        if RE_OV_LIST.fullmatch(input_str):
             ov_list = [int(s) for s in input_str.split(',')]
         else:
             ov_list = []